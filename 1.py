@@ -1,42 +1,29 @@
+from crc import crc_str
+from crc_analysis import collision_census, crc_function
+
+
 def xor(a, b):
     # Функция XOR для двух бинарных строк
     return ''.join(str(int(x) ^ int(y)) for x, y in zip(a, b))
 
 
 def crc(data, generating_polynomial):
-    # Функция для вычисления CRC
-    gx_len = len(generating_polynomial)
-    data += '0' * gx_len
-    num = data[:gx_len]
-
-    if len(str(int(data))) < gx_len:
-        return str(int(num))
-
-    data = data.replace(data[:gx_len], "", 1)
-
-    while True:
-        remainder = str(int(xor(num, generating_polynomial)))
+    # Функция для вычисления CRC (остаток от деления data * x^len(G) на G)
+    remainder = crc_str(data, generating_polynomial, len(generating_polynomial))
+    return str(int(remainder))
 
-        if remainder == '0':
-            if len(data) <= gx_len and int(data) == 0:
-                return remainder
 
-            num = data[:gx_len]
-            data = data.replace(data[:gx_len], "", 1)
-
-            if len(num) < gx_len:
-                return num
-        else:
-            remainder_len = gx_len - len(remainder)
-            num = remainder + data[:remainder_len]
-            data = data.replace(data[:remainder_len], "", 1)
-
-            if len(num) < gx_len:
-                return num
+def detect_crc_collision(iterations, generating_polynomial):
+    # Функция для обнаружения коллизий CRC среди чисел 0..iterations-1
+    nbits = iterations.bit_length() - 1
 
+    if iterations == 1 << nbits:
+        # Перебираются все nbits-битовые числа: корзины строятся через линейность CRC
+        func = crc_function(generating_polynomial, len(generating_polynomial))
+        _, buckets = collision_census(generating_polynomial, nbits, func)
+        return {format(key, 'b'): numbers
+                for key, numbers in sorted(buckets.items(), key=lambda item: item[1][0])}
 
-def detect_crc_collision(iterations, generating_polynomial):
-    # Функция для обнаружения коллизий CRC
     collisions = {}
 
     for num in range(iterations):
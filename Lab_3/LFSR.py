@@ -1,6 +1,153 @@
+from functools import lru_cache
+
+from gf2 import GF2MatrixPowers
+
 s_1, s_2, s_3 = -1, -3, -8  # Номер битов,которые ксорим
 
 
+def taps_from_indices(*indices):  # Номера символов строки-регистра (-1 - последний) -> битовая маска
+    return sum(1 << (-i - 1) for i in indices)
+
+
+TAPS = taps_from_indices(s_1, s_2, s_3)  # 0b10000101
+SEED = int("11010101", 2)  # Начальное состояние регистра
+
+
+class LFSR:
+    """
+    Регистр сдвига с линейной обратной связью, состояние хранится в int.
+
+    Бит i состояния соответствует символу с индексом -(i + 1) строки-регистра из main_func,
+    выходной бит - младший бит состояния.
+    form='fibonacci': новый старший бит - чётность (state & taps), регистр сдвигается вправо.
+    form='galois': регистр сдвигается вправо, и если выдвинута 1, состояние XOR-ится с taps.
+    """
+
+    def __init__(self, width=8, taps=TAPS, state=SEED, form='fibonacci'):
+        if form not in ('fibonacci', 'galois'):
+            raise ValueError("form должен быть 'fibonacci' или 'galois'")
+        self.width = width
+        self.taps = taps
+        self.form = form
+        self.mask = (1 << width) - 1
+        self.state = state & self.mask
+
+    def __repr__(self):
+        return f"LFSR(width={self.width}, taps={self.taps:#x}, state={self.state:#x}, form={self.form!r})"
+
+    def copy(self):
+        return LFSR(self.width, self.taps, self.state, self.form)
+
+    def next_bit(self):
+        """Один такт: возвращает выдвинутый бит"""
+        s = self.state
+        out = s & 1
+        if self.form == 'fibonacci':
+            self.state = (s >> 1) | (((s & self.taps).bit_count() & 1) << (self.width - 1))
+        else:
+            self.state = (s >> 1) ^ self.taps if out else s >> 1
+        return out
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.next_bit()
+
+    def next_bits(self, n):
+        """n тактов, результат - число, первый бит старший"""
+        result = 0
+        for _ in range(n):
+            result = (result << 1) | self.next_bit()
+        return result
+
+    def next_bytes(self, n):
+        """
+        n байтов гаммы (первый бит - старший бит первого байта).
+        Работает по таблицам: за один шаг выдаётся целый блок битов по байтам состояния.
+        """
+        out = bytearray()
+        big = _step_tables(self.width, self.taps, self.form, BLOCK_BITS)
+        small = _step_tables(self.width, self.taps, self.form, 8)
+
+        blocks, rest = divmod(n, BLOCK_BITS // 8)
+        state = self.state
+        if blocks:
+            state = _run_tables(big, state, blocks, BLOCK_BITS // 8, out)
+        if rest:
+            state = _run_tables(small, state, rest, 1, out)
+        self.state = state
+        return bytes(out)
+
+    def jump(self, n_steps):
+        """
+        Сдвигает регистр на n_steps тактов вперёд за O(log n) умножений матриц над GF(2)
+        (выходные биты при этом не выдаются).
+        """
+        self.state = _transition_powers(self.width, self.taps, self.form).times(self.state, n_steps)
+        return self
+
+    def stream(self, chunk_size=1 << 16):
+        """Бесконечный генератор гаммы блоками по chunk_size байтов"""
+        while True:
+            yield self.next_bytes(chunk_size)
+
+
+BLOCK_BITS = 512  # Число битов гаммы за один табличный шаг
+
+
+@lru_cache(maxsize=32)
+def _transition_powers(width, taps, form):
+    # Степени матрицы одного такта (общие для потоков); столбец i - состояние после такта из 1 << i
+    columns = []
+    for i in range(width):
+        reg = LFSR(width, taps, 1 << i, form)
+        reg.next_bit()
+        columns.append(reg.state)
+    return GF2MatrixPowers(columns)
+
+
+@lru_cache(maxsize=32)
+def _step_tables(width, taps, form, nbits):
+    """
+    Таблицы для nbits тактов сразу. Переход линейный, поэтому достаточно знать результат
+    для каждого бита состояния; table[j][b] - (новое состояние, выход) от байта b на позиции j.
+    """
+    basis = []
+    for i in range(width):
+        reg = LFSR(width, taps, 1 << i, form)
+        out = reg.next_bits(nbits)
+        basis.append((reg.state, out))
+
+    tables = []
+    for j in range(0, width, 8):
+        table = [(0, 0)]
+        for st, ou in basis[j:j + 8]:
+            table += [(s ^ st, o ^ ou) for s, o in table]  # удвоение: добавляем очередной бит
+        tables.append(table)
+    return tables
+
+
+def _run_tables(tables, state, steps, nbytes, out):
+    # steps табличных шагов по nbytes байтов, выход дописывается в out
+    if len(tables) == 1:
+        table = tables[0]
+        for _ in range(steps):
+            state, bits = table[state]
+            out += bits.to_bytes(nbytes, 'big')
+        return state
+
+    for _ in range(steps):
+        new_state = bits = 0
+        for j, table in enumerate(tables):
+            s, o = table[(state >> (8 * j)) & 0xFF]
+            new_state ^= s
+            bits ^= o
+        state = new_state
+        out += bits.to_bytes(nbytes, 'big')
+    return state
+
+
 def solution(text, n):  # Последовательности на разбиение на строки по 8 бит
     a = [text[i:i + n] for i in range(0, len(text), n)]
     return a
@@ -23,29 +170,11 @@ def func_conciders(y):  # Счёт количества нулей
     return count_zero
 
 
-def main_func():
-    count = 1  # Общий счётчик (начинается с одного т.к первый элемент обрабатывается вне цикла)
-    i = 1  # Ещё один счётчик
-    bin_i = "11010101"  # Начальное состояние регистра;
-
-    # Обработка нулевого элемента вне цикла:
-
-    a_0 = str((int(bin_i[s_1]) + int(bin_i[s_2]) + int(bin_i[s_3])) % 2)
-
-    gen_bit = bin_i[7]  # Массив хранящий вытесненые биты
-    buf = a_0 + bin_i[0:7]
-
-    while True:
-
-        a = str((int(buf[s_1]) + int(buf[s_2]) + int(buf[s_3])) % 2)
-
-        count += 1
-        gen_bit += buf[7]
-        buf = a + buf[0:7]
-
-        i += 1
+def main_func():  # Гамма за один период регистра (список битов)
+    reg = LFSR(8, TAPS, SEED)
 
-        if bin_i == buf:
-            break
+    gen_bit = [reg.next_bit()]  # Массив хранящий вытесненые биты
+    while reg.state != SEED:
+        gen_bit.append(reg.next_bit())
 
-    return list(map(int, solution(gen_bit, 1)))
+    return gen_bit
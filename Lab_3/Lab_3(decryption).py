@@ -1,40 +1,13 @@
-import os
-from LFSR import main_func as lfsr
-from tkinter import filedialog
+from gamma_cipher import decrypt_file
 
 
-def dec_func(path_2):
-    with open(path_2, 'rb') as f:
-        file_code = f.read()
+def dec_func(path_2, keystream=None):  # Расшифрование: файл читается и пишется блоками, гамма берётся по смещению блока
+    # keystream - объект гаммы или имя из gamma_cipher.KEYSTREAMS (по умолчанию гамма лабораторной)
+    return decrypt_file(path_2, keystream)
 
-    gamma = lfsr()
-    i = 0
 
-    if len(file_code) > len(gamma):
-        while True:
+if __name__ == '__main__':  # Диалог выбора файла; для пакетной обработки без Tk - gamma_batch.py
+    from tkinter import filedialog
 
-            gamma.append(gamma[i])
-            i += 1
-
-            if len(gamma) == len(file_code):
-                break
-
-    elif len(file_code) < len(gamma):
-        while True:
-
-            gamma.pop()
-            i += 1
-
-            if len(gamma) == len(file_code):
-                break
-
-    dec_data = (map(lambda a, b: a ^ b, file_code, gamma))
-
-    dec_path = os.path.splitext(path_2)[0][:-4] + '_dec' + os.path.splitext(path_2)[1]
-
-    with open(dec_path, 'wb+') as f_1:
-        f_1.write(bytes(dec_data))
-
-
-name_1 = filedialog.askopenfilename()
-dec_func(name_1)
+    name_1 = filedialog.askopenfilename()
+    dec_func(name_1)
@@ -0,0 +1,220 @@
+# Нелинейные генераторы гаммы из нескольких регистров LFSR (Геффе, сжимающий, с чередующимся шагом, фильтрующий)
+import argparse
+import time
+
+import numpy as np
+
+from LFSR import LFSR
+
+
+def _bits(data):  # bytes -> массив битов np.uint8 (старший бит байта первый)
+    return np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+
+
+class BitBuffer:
+    """Побитовое чтение из регистра: биты берутся у reg.next_bytes целыми байтами, остаток хранится"""
+
+    def __init__(self, reg):
+        self.reg = reg
+        self.rest = np.zeros(0, dtype=np.uint8)
+
+    def copy(self):
+        buf = BitBuffer(self.reg.copy())
+        buf.rest = self.rest.copy()
+        return buf
+
+    def take(self, n):
+        if n > len(self.rest):
+            need = n - len(self.rest)
+            self.rest = np.concatenate((self.rest, _bits(self.reg.next_bytes((need + 7) // 8))))
+        bits, self.rest = self.rest[:n], self.rest[n:]
+        return bits
+
+
+class CombinedGenerator:
+    """
+    Общая часть генераторов: подкласс реализует _next_bits(n) - следующие n битов (n кратно 8)
+    как массив np.uint8. Выход выдаётся байтами, как LFSR.next_bytes.
+    seekable - skip работает прыжками регистров; иначе пропуск генерирует и отбрасывает гамму.
+    """
+
+    seekable = False
+
+    def next_bytes(self, n):
+        return np.packbits(self._next_bits(8 * n)).tobytes()
+
+    def skip(self, nbytes, block=1 << 16):  # Пропуск nbytes байтов гаммы
+        while nbytes > 0:
+            self.next_bytes(min(block, nbytes))
+            nbytes -= block
+
+    def stream(self, chunk_size=1 << 16):
+        while True:
+            yield self.next_bytes(chunk_size)
+
+
+class GeffeGenerator(CombinedGenerator):
+    """Генератор Геффе: выход x2, если x1 = 1, иначе x3 (x1 - выход первого регистра)"""
+
+    seekable = True
+
+    def __init__(self, r1=None, r2=None, r3=None):
+        self.r1 = r1 or LFSR(17, 0b1001, 0x1ACE5)
+        self.r2 = r2 or LFSR(19, 0b100111, 0x5B0D3)
+        self.r3 = r3 or LFSR(23, 0b100001, 0x3C96E1)
+
+    def copy(self):
+        return GeffeGenerator(self.r1.copy(), self.r2.copy(), self.r3.copy())
+
+    def next_bytes(self, n):  # Побитовые операции сразу над байтами, без распаковки
+        x1 = np.frombuffer(self.r1.next_bytes(n), dtype=np.uint8)
+        x2 = np.frombuffer(self.r2.next_bytes(n), dtype=np.uint8)
+        x3 = np.frombuffer(self.r3.next_bytes(n), dtype=np.uint8)
+        return ((x1 & x2) ^ (~x1 & x3)).tobytes()
+
+    def skip(self, nbytes):  # Регистры тактуются независимо - достаточно прыжка каждого
+        for reg in (self.r1, self.r2, self.r3):
+            reg.jump(8 * nbytes)
+
+
+class ShrinkingGenerator(CombinedGenerator):
+    """Сжимающий генератор: бит регистра a выдаётся, только если одновременный бит регистра s равен 1"""
+
+    def __init__(self, a=None, s=None):
+        self.a = a or LFSR(29, 0b101, 0x0B5E7A9D)
+        self.s = s or LFSR(31, 0b1001, 0x5A3C96E1)
+        self.rest = np.zeros(0, dtype=np.uint8)
+
+    def copy(self):
+        gen = ShrinkingGenerator(self.a.copy(), self.s.copy())
+        gen.rest = self.rest.copy()
+        return gen
+
+    def _next_bits(self, n):
+        parts = [self.rest]
+        have = len(self.rest)
+        while have < n:
+            nbytes = max(64, (n - have) // 4 + 1)  # в среднем выдаётся половина битов
+            a = _bits(self.a.next_bytes(nbytes))
+            s = _bits(self.s.next_bytes(nbytes))
+            parts.append(a[s == 1])
+            have += len(parts[-1])
+        bits = np.concatenate(parts)
+        self.rest = bits[n:]
+        return bits[:n]
+
+
+class AlternatingStepGenerator(CombinedGenerator):
+    """
+    Генератор с чередующимся шагом: регистр c управляет тактированием -
+    при выходе c, равном 1, тактируется r1, иначе r2. Выход - XOR последних выходов r1 и r2
+    (до первого такта регистра его выход считается нулевым).
+    """
+
+    def __init__(self, c=None, r1=None, r2=None):
+        self.c = c or LFSR(21, 0b101, 0x1F00D5)
+        self.r1 = BitBuffer(r1 or LFSR(22, 0b11, 0x2BEEF1))
+        self.r2 = BitBuffer(r2 or LFSR(25, 0b1001, 0x1C0FFEE))
+        self.last = np.zeros(2, dtype=np.uint8)
+
+    def copy(self):
+        gen = AlternatingStepGenerator(self.c.copy())
+        gen.r1, gen.r2 = self.r1.copy(), self.r2.copy()
+        gen.last = self.last.copy()
+        return gen
+
+    def _next_bits(self, n):
+        c = _bits(self.c.next_bytes(n // 8))
+        k = int(np.count_nonzero(c))
+        # Индекс в x1 - число тактов r1 к данному моменту; x1[0] - выход до этих n тактов
+        x1 = np.concatenate((self.last[:1], self.r1.take(k)))
+        x2 = np.concatenate((self.last[1:], self.r2.take(n - k)))
+        i1 = np.cumsum(c, dtype=np.int64)
+        i2 = np.arange(1, n + 1) - i1
+        self.last = np.array([x1[-1], x2[-1]], dtype=np.uint8)
+        return x1[i1] ^ x2[i2]
+
+
+def truth_table(func, nvars):  # Таблица истинности: элемент i - func от битов числа i (бит j - аргумент j)
+    return np.array([func(*((i >> j) & 1 for j in range(nvars))) & 1 for i in range(1 << nvars)], dtype=np.uint8)
+
+
+def default_filter(x0, x1, x2, x3, x4, x5):  # Сбалансированная функция степени 2
+    return x0 ^ x1 ^ (x2 & x3) ^ (x4 & x5) ^ (x1 & x4)
+
+
+class FilterGenerator(CombinedGenerator):
+    """
+    Фильтрующий генератор: выход - булева функция от битов состояния регистра
+    на позициях positions (table - её таблица истинности, см. truth_table).
+    Регистр должен быть в форме Фибоначчи: тогда бит i состояния в такт t - это выходной бит t + i,
+    и функция считается по сдвинутым копиям выходной последовательности.
+    """
+
+    seekable = True
+
+    def __init__(self, reg=None, positions=(0, 3, 7, 12, 20, 30), table=None):
+        reg = reg or LFSR(31, 0b1001, 0x2D1B5A77)
+        if reg.form != 'fibonacci':
+            raise ValueError("Фильтрующему генератору нужен регистр в форме Фибоначчи")
+        if max(positions) >= reg.width:
+            raise ValueError("Позиции должны быть меньше разрядности регистра")
+        self.reg = reg
+        self.positions = tuple(positions)
+        self.table = truth_table(default_filter, 6) if table is None else np.asarray(table, dtype=np.uint8)
+        # Окно из следующих lag выходных битов: регистр всегда опережает выход на lag тактов
+        self.lag = max(self.positions)
+        self.ahead = np.array([reg.next_bit() for _ in range(self.lag)], dtype=np.uint8)
+
+    def copy(self):
+        gen = FilterGenerator.__new__(FilterGenerator)
+        gen.reg, gen.positions, gen.table, gen.lag = self.reg.copy(), self.positions, self.table, self.lag
+        gen.ahead = self.ahead.copy()
+        return gen
+
+    def _next_bits(self, n):
+        seq = np.concatenate((self.ahead, _bits(self.reg.next_bytes(n // 8))))
+        index = np.zeros(n, dtype=np.int64)
+        for j, p in enumerate(self.positions):
+            index |= seq[p:p + n].astype(np.int64) << j
+        self.ahead = seq[n:]
+        return self.table[index]
+
+    def skip(self, nbytes):
+        if 8 * nbytes < self.lag:
+            return super().skip(nbytes)
+        self.reg.jump(8 * nbytes - self.lag)
+        self.ahead = np.array([self.reg.next_bit() for _ in range(self.lag)], dtype=np.uint8)
+
+
+GENERATORS = {
+    'geffe': GeffeGenerator,
+    'shrinking': ShrinkingGenerator,
+    'alternating': AlternatingStepGenerator,
+    'filter': FilterGenerator,
+}
+
+
+def benchmark(gen, nbytes=1 << 22, chunk_size=1 << 16):
+    """Скорость генерации: {'bytes', 'time', 'mb_s'}"""
+    start = time.perf_counter()
+    done = 0
+    while done < nbytes:
+        done += len(gen.next_bytes(min(chunk_size, nbytes - done)))
+    elapsed = time.perf_counter() - start
+    return {'bytes': done, 'time': elapsed, 'mb_s': done / 2 ** 20 / max(elapsed, 1e-9)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Скорость нелинейных генераторов гаммы")
+    parser.add_argument('names', nargs='*', default=sorted(GENERATORS), help="генераторы")
+    parser.add_argument('--size', type=int, default=1 << 22, help="объём гаммы в байтах")
+    args = parser.parse_args(argv)
+
+    for name in args.names:
+        res = benchmark(GENERATORS[name](), args.size)
+        print(f"{name.ljust(12)} {res['bytes'] / 2 ** 20:.1f} МБ за {res['time']:.2f} с ({res['mb_s']:.1f} МБ/с)")
+
+
+if __name__ == '__main__':
+    main()
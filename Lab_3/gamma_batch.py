@@ -0,0 +1,150 @@
+# Пакетное гаммирование файлов из командной строки (без Tk)
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)  # Чтение и запись JSON общие с переборами в корне репозитория
+
+from batch_cache import load_json, save_json
+from gamma_cipher import CHUNK_SIZE, KEYSTREAMS, dec_path, decrypt_file, enc_path, encrypt_file
+
+MODES = {
+    'enc': (encrypt_file, enc_path),
+    'dec': (decrypt_file, dec_path),
+}
+
+MANIFEST = '.gamma_batch.json'  # Файл в каталоге результатов: {имя результата: имя гаммы}
+
+
+def _is_output(path):  # Результаты и манифесты прошлых запусков: file_enc.txt, file_dec.txt
+    stem = os.path.splitext(path)[0]
+    return stem.endswith('_enc') or stem.endswith('_dec') or os.path.basename(path).startswith(MANIFEST)
+
+
+def collect_files(patterns, mode):
+    """
+    Список файлов для обработки: pattern - каталог (обходится рекурсивно) или шаблон glob.
+    Для шифрования пропускаются файлы _enc/_dec, для расшифрования берутся только файлы _enc.
+    """
+    found = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, _, names in os.walk(pattern):
+                found += [os.path.join(root, name) for name in sorted(names)]
+        else:
+            found += sorted(glob.glob(pattern, recursive=True))
+
+    files = []
+    seen = set()
+    for path in found:
+        if not os.path.isfile(path) or path in seen:
+            continue
+        seen.add(path)
+        if mode == 'enc' and _is_output(path):
+            continue
+        if mode == 'dec' and not os.path.splitext(path)[0].endswith('_enc'):
+            continue
+        files.append(path)
+    return files
+
+
+def manifest_path(dst):
+    return os.path.join(os.path.dirname(dst), MANIFEST)
+
+
+def is_up_to_date(src, dst, keystream='lab', manifests=None):
+    """
+    Результат есть, не старше исходного файла, того же размера и, по манифесту каталога,
+    получен гаммой keystream. manifests - словарь уже прочитанных манифестов {путь: содержимое}.
+    """
+    if not os.path.exists(dst):
+        return False
+    if manifests is None:
+        manifests = {}
+    path = manifest_path(dst)
+    if path not in manifests:
+        manifests[path] = load_json(path)
+    if manifests[path].get(os.path.basename(dst)) != keystream:
+        return False
+    return os.path.getmtime(dst) >= os.path.getmtime(src) and os.path.getsize(dst) == os.path.getsize(src)
+
+
+def record_outputs(outs, keystream):  # Запись в манифесты, какой гаммой получены файлы outs
+    manifests = {}
+    for out in outs:
+        path = manifest_path(out)
+        if path not in manifests:
+            manifests[path] = load_json(path)
+        manifests[path][os.path.basename(out)] = keystream
+    for path, entries in manifests.items():
+        save_json(path, entries)
+
+
+def process_file(path, mode, keystream='lab', chunk_size=CHUNK_SIZE):
+    """Гаммирует один файл гаммой с именем keystream, возвращает {'path', 'out', 'size', 'time'}"""
+    func = MODES[mode][0]
+    start = time.perf_counter()
+    out = func(path, keystream, chunk_size)
+    return {'path': path, 'out': out, 'size': os.path.getsize(path), 'time': time.perf_counter() - start}
+
+
+def process_files(paths, mode, workers=None, processes=False, force=False, keystream='lab', chunk_size=CHUNK_SIZE):
+    """
+    Гаммирует файлы в пуле потоков (или процессов при processes=True).
+    Файлы, результат которых уже актуален для этой гаммы, пропускаются (если не задан force);
+    имена гамм результатов хранятся в манифесте MANIFEST каталога.
+    Возвращает (список результатов process_file, список пропущенных файлов).
+    """
+    out_path = MODES[mode][1]
+    todo, skipped = [], []
+    manifests = {}
+    for path in paths:
+        (skipped if not force and is_up_to_date(path, out_path(path), keystream, manifests) else todo).append(path)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(todo) <= 1:
+        results = [process_file(path, mode, keystream, chunk_size) for path in todo]
+    else:
+        executor = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        with executor(max_workers=workers) as pool:
+            futures = [pool.submit(process_file, path, mode, keystream, chunk_size) for path in todo]
+            results = [future.result() for future in futures]
+    record_outputs([res['out'] for res in results], keystream)
+    return results, skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Пакетное шифрование/расшифрование файлов гаммой LFSR")
+    parser.add_argument('mode', choices=sorted(MODES), help="enc - шифрование, dec - расшифрование")
+    parser.add_argument('paths', nargs='+', help="файлы, каталоги или шаблоны glob")
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count(), help="размер пула")
+    parser.add_argument('--processes', action='store_true', help="пул процессов вместо пула потоков")
+    parser.add_argument('-k', '--keystream', default='lab', choices=KEYSTREAMS, help="гамма")
+    parser.add_argument('-f', '--force', action='store_true', help="обрабатывать и актуальные файлы")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="размер блока чтения в байтах")
+    args = parser.parse_args(argv)
+
+    files = collect_files(args.paths, args.mode)
+    start = time.perf_counter()
+    results, skipped = process_files(files, args.mode, args.workers, args.processes, args.force,
+                                      args.keystream, args.chunk_size)
+    elapsed = time.perf_counter() - start
+
+    for res in results:
+        speed = res['size'] / 2 ** 20 / max(res['time'], 1e-9)
+        print(f"{res['path']} -> {res['out']}: {res['size'] / 2 ** 20:.1f} МБ за {res['time']:.2f} с ({speed:.1f} МБ/с)")
+    for path in skipped:
+        print(f"{path}: результат актуален, пропущен")
+
+    total = sum(res['size'] for res in results)
+    print(f"Обработано файлов: {len(results)}, пропущено: {len(skipped)}; "
+          f"{total / 2 ** 20:.1f} МБ за {elapsed:.2f} с ({total / 2 ** 20 / max(elapsed, 1e-9):.1f} МБ/с)")
+
+
+if __name__ == '__main__':
+    main()
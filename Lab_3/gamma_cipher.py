@@ -0,0 +1,220 @@
+# Потоковое гаммирование файлов: файл читается блоками, память не зависит от размера файла
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+from LFSR import LFSR, SEED, TAPS
+from combined_generators import GENERATORS
+from lfsr_analysis import seed_period
+
+CHUNK_SIZE = 1 << 20  # Размер блока чтения в байтах
+
+
+MAX_PERIOD = 1 << 28  # Наибольший период, который имеет смысл держать в памяти
+
+
+@lru_cache(maxsize=16)
+def period_array(width=8, taps=TAPS, seed=SEED, form='fibonacci', packed=False):
+    """
+    Один период выхода регистра как массив np.uint8 (кэшируется по параметрам регистра).
+    packed=False - по биту на байт, как гамма main_func;
+    packed=True - упакованные биты (8 на байт); для нечётного периода P это P байтов.
+    Если начальное состояние не повторяется (необратимый регистр), выдаётся ValueError.
+    Регистр Галуа без старшего бита в маске не поддерживается (см. lfsr_analysis.characteristic_poly).
+    """
+    reg = LFSR(width, taps, seed, form)
+    # Период - по характеристическому многочлену, без прохода по всему циклу
+    period = seed_period(width, taps, reg.state, form)
+    if reg.copy().jump(period).state != reg.state:
+        # Отображение необратимо (многочлен делится на x), и seed не лежит на цикле
+        raise ValueError("Начальное состояние не повторяется: гамма не периодична с начала")
+    if period > MAX_PERIOD:
+        raise ValueError("Период регистра слишком велик для таблицы")
+
+    if packed:
+        # Упакованная гамма повторяется через lcm(P, 8) битов
+        nbytes = period // np.gcd(period, 8)
+        array = np.frombuffer(reg.next_bytes(nbytes), dtype=np.uint8)
+    else:
+        array = np.array([reg.next_bit() for _ in range(period)], dtype=np.uint8)
+    array.flags.writeable = False
+    return array
+
+
+class PeriodicKeystream:
+    """
+    Периодическая гамма: period - один период (байты или массив np.uint8).
+    keystream(offset, n) - n байтов гаммы, начиная с позиции offset файла.
+    """
+
+    seekable = True  # Позиция находится без генерации гаммы до неё
+
+    def __init__(self, period):
+        if not isinstance(period, np.ndarray):
+            period = np.frombuffer(bytes(period), dtype=np.uint8)
+        self.period = period
+
+    @classmethod
+    def from_lfsr(cls, width=8, taps=TAPS, seed=SEED, form='fibonacci', packed=False):
+        return cls(period_array(width, taps, seed, form, packed))
+
+    def keystream(self, offset, n):
+        start = offset % len(self.period)
+        return np.resize(np.roll(self.period, -start), n)
+
+
+class LFSRKeystream:
+    """
+    Гамма из упакованного выхода регистра (8 битов на байт).
+    Позиция offset находится прыжком регистра, без генерации всей гаммы до неё.
+    """
+
+    seekable = True
+
+    def __init__(self, lfsr_reg):
+        self.reg = lfsr_reg.copy()
+
+    def keystream(self, offset, n):
+        reg = self.reg.copy().jump(8 * offset)
+        return reg.next_bytes(n)
+
+
+class GeneratorKeystream:
+    """
+    Гамма из генератора с методами next_bytes, skip и copy (см. combined_generators).
+    Последовательные блоки берутся без перезапуска; при переходе к другому смещению
+    копия начального генератора пропускает offset байтов.
+    """
+
+    def __init__(self, generator):
+        self.initial = generator.copy()
+        self.seekable = generator.seekable
+        self.gen = None
+        self.pos = 0
+
+    def keystream(self, offset, n):
+        if self.gen is None or offset != self.pos:
+            self.gen = self.initial.copy()
+            self.gen.skip(offset)
+        self.pos = offset + n
+        return self.gen.next_bytes(n)
+
+
+def default_keystream():  # Гамма лабораторной: биты одного периода регистра, по биту на байт
+    return PeriodicKeystream.from_lfsr()
+
+
+KEYSTREAMS = ['lab', 'lfsr'] + sorted(GENERATORS)  # Имена гамм для make_keystream
+
+
+def make_keystream(name='lab'):
+    """
+    Гамма по имени: 'lab' - гамма лабораторной, 'lfsr' - упакованный выход регистра лабораторной,
+    остальные - нелинейные генераторы из combined_generators с параметрами по умолчанию.
+    """
+    if name == 'lab':
+        return default_keystream()
+    if name == 'lfsr':
+        return LFSRKeystream(LFSR())
+    if name in GENERATORS:
+        return GeneratorKeystream(GENERATORS[name]())
+    raise ValueError(f"Неизвестная гамма: {name}")
+
+
+def xor_bytes(data, key):  # XOR буфера с гаммой (bytes или np.uint8) одной операцией NumPy
+    data = np.frombuffer(data, dtype=np.uint8)
+    if not isinstance(key, np.ndarray):
+        key = np.frombuffer(key, dtype=np.uint8)
+    return np.bitwise_xor(data, key[:len(data)]).tobytes()
+
+
+def xor_file(src, dst, keystream=None, chunk_size=CHUNK_SIZE):
+    """
+    Гаммирует файл src в dst блоками по chunk_size байтов, возвращает число байтов.
+    keystream - объект с методом keystream(offset, n) или имя гаммы для make_keystream.
+    """
+    if keystream is None:
+        keystream = default_keystream()
+    elif isinstance(keystream, str):
+        keystream = make_keystream(keystream)
+
+    offset = 0
+    with open(src, 'rb') as f_in, open(dst, 'wb') as f_out:
+        while True:
+            chunk = f_in.read(chunk_size)
+            if not chunk:
+                break
+            f_out.write(xor_bytes(chunk, keystream.keystream(offset, len(chunk))))
+            offset += len(chunk)
+    return offset
+
+
+def _xor_range(src, dst, keystream, start, length, chunk_size):
+    # Гаммирование участка файла в отдельном процессе, запись по смещению в готовый файл
+    with open(src, 'rb') as f_in, open(dst, 'r+b') as f_out:
+        f_in.seek(start)
+        offset = start
+        end = start + length
+        while offset < end:
+            chunk = f_in.read(min(chunk_size, end - offset))
+            if not chunk:
+                break
+            data = xor_bytes(chunk, keystream.keystream(offset, len(chunk)))
+            if hasattr(os, 'pwrite'):
+                os.pwrite(f_out.fileno(), data, offset)
+            else:
+                f_out.seek(offset)
+                f_out.write(data)
+            offset += len(chunk)
+    return offset - start
+
+
+def xor_file_parallel(src, dst, keystream=None, workers=None, chunk_size=CHUNK_SIZE, part_size=1 << 26):
+    """
+    Гаммирует файл в пуле процессов: выходной файл заранее создаётся нужного размера,
+    файл делится на участки по part_size байтов (кратно chunk_size), каждый процесс
+    сам находит гамму по смещению своего участка. Небольшие файлы гаммируются в текущем процессе,
+    как и файлы с гаммой, у которой нет дешёвого перехода к смещению (seekable = False):
+    каждый процесс генерировал бы всю гамму до своего участка.
+    """
+    if keystream is None:
+        keystream = default_keystream()
+    elif isinstance(keystream, str):
+        keystream = make_keystream(keystream)
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(src)
+
+    if workers == 1 or size <= part_size or not getattr(keystream, 'seekable', True):
+        return xor_file(src, dst, keystream, chunk_size)
+
+    with open(dst, 'wb') as f_out:
+        f_out.truncate(size)
+
+    part_size = max(chunk_size, part_size // chunk_size * chunk_size)
+    starts = range(0, size, part_size)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_xor_range, src, dst, keystream, start, min(part_size, size - start), chunk_size)
+                   for start in starts]
+        return sum(future.result() for future in futures)
+
+
+def enc_path(path):  # file.txt -> file_enc.txt
+    return os.path.splitext(path)[0] + '_enc' + os.path.splitext(path)[1]
+
+
+def dec_path(path):  # file_enc.txt -> file_dec.txt
+    return os.path.splitext(path)[0][:-4] + '_dec' + os.path.splitext(path)[1]
+
+
+def encrypt_file(path, keystream=None, chunk_size=CHUNK_SIZE, workers=1):
+    out = enc_path(path)
+    xor_file_parallel(path, out, keystream, workers, chunk_size)
+    return out
+
+
+def decrypt_file(path, keystream=None, chunk_size=CHUNK_SIZE, workers=1):
+    out = dec_path(path)
+    xor_file_parallel(path, out, keystream, workers, chunk_size)
+    return out
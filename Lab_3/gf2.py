@@ -0,0 +1,76 @@
+# Арифметика над GF(2): многочлены; степени матриц (GF2MatrixPowers) - из gf2_matrix.py
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)  # Матрицы над GF(2) - в gf2_matrix.py в корне репозитория
+
+from gf2_matrix import GF2MatrixPowers
+
+
+# Многочлены над GF(2) - числа: бит i - коэффициент при x^i
+
+def poly_deg(a):
+    return a.bit_length() - 1
+
+
+def poly_square(a):  # Квадрат: коэффициенты раздвигаются нулями
+    return int('0'.join(format(a, 'b')), 2) if a else 0
+
+
+def poly_mul(a, b):  # Умножение без переносов
+    if a.bit_length() < b.bit_length():
+        a, b = b, a
+    result = 0
+    while b:
+        low = b & -b
+        result ^= a << (low.bit_length() - 1)
+        b ^= low
+    return result
+
+
+def poly_mod(a, m):
+    m_len = m.bit_length()
+    while a.bit_length() >= m_len:
+        a ^= m << (a.bit_length() - m_len)
+    return a
+
+
+def poly_divmod(a, m):
+    q = 0
+    m_len = m.bit_length()
+    while a.bit_length() >= m_len:
+        shift = a.bit_length() - m_len
+        q |= 1 << shift
+        a ^= m << shift
+    return q, a
+
+
+def poly_mulmod(a, b, m):
+    return poly_mod(poly_mul(a, b), m)
+
+
+def poly_powmod(a, e, m):  # a^e mod m, возведение в квадрат через раздвигание битов
+    result = 1
+    a = poly_mod(a, m)
+    for bit in format(e, 'b'):
+        result = poly_mod(poly_square(result), m)
+        if bit == '1':
+            result = poly_mod(poly_mul(result, a), m)
+    return poly_mod(result, m)
+
+
+def poly_gcd(a, b):
+    while b:
+        a, b = b, poly_mod(a, b)
+    return a
+
+
+def poly_derivative(a):  # Производная: остаются нечётные степени, сдвинутые на один
+    return (a >> 1) & int('01' * (a.bit_length() // 2 + 1), 2)
+
+
+def poly_sqrt(a):  # Корень из многочлена, у которого только чётные степени
+    bits = format(a, 'b')[::-1][::2]
+    return int(bits[::-1], 2) if a else 0
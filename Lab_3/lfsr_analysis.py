@@ -0,0 +1,260 @@
+# Анализ регистров сдвига через характеристический многочлен над GF(2)
+import os
+import random
+import sys
+from functools import lru_cache
+from math import gcd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)  # Разложение чисел и алгоритм Берлекэмпа-Мэсси - в корне репозитория
+
+import berlekamp_massey
+from gf2 import poly_deg, poly_derivative, poly_divmod, poly_gcd, poly_mod, poly_powmod, poly_sqrt, poly_square
+from LFSR import LFSR
+from numtheory import factorize
+
+# --- Разложение 2^d - 1 ---
+
+def _divisors_of(d):
+    return [k for k in range(1, d + 1) if d % k == 0]
+
+
+@lru_cache(maxsize=None)
+def factorize_mersenne(d):
+    """
+    Разложение 2^d - 1. Число раскладывается на значения круговых многочленов
+    Phi_k(2), k | d, которые заметно меньше и раскладываются по отдельности.
+    """
+    factors = {}
+    for k in _divisors_of(d):
+        # Phi_k(2) = prod (2^j - 1)^mu(k/j) по делителям j числа k
+        num, den = 1, 1
+        for j in _divisors_of(k):
+            mu = _mobius(k // j)
+            if mu == 1:
+                num *= (1 << j) - 1
+            elif mu == -1:
+                den *= (1 << j) - 1
+        for p, e in factorize(num // den).items():
+            factors[p] = factors.get(p, 0) + e
+    return dict(sorted(factors.items()))
+
+
+def _mobius(n):
+    result = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    return -result if n > 1 else result
+
+
+# --- Многочлены регистра ---
+
+def characteristic_poly(width, taps, form='fibonacci'):
+    """
+    Характеристический многочлен регистра (класс LFSR).
+    fibonacci: a[t + n] = sum a[t + i] по битам i маски, многочлен x^n + sum x^i.
+    galois: такт - умножение состояния на x^-1 по модулю 1 + x * taps(x).
+    """
+    if form == 'fibonacci':
+        return (1 << width) | taps
+    if not taps >> (width - 1) & 1:
+        raise ValueError("У регистра Галуа в маске должен быть старший бит")
+    return 1 | (taps << 1)
+
+
+def squarefree_factorization(f):
+    """Пары (g, e): f = prod g^e, g свободны от квадратов"""
+    result = []
+    e = 1
+    while poly_deg(f) > 0:
+        d = poly_derivative(f)
+        if d == 0:
+            # f - квадрат: переходим к корню
+            f = poly_sqrt(f)
+            e *= 2
+            continue
+        g = poly_gcd(f, d)
+        w = poly_divmod(f, g)[0]
+        i = 1
+        while poly_deg(w) > 0:
+            y = poly_gcd(w, g)
+            z = poly_divmod(w, y)[0]
+            if poly_deg(z) > 0:
+                result.append((z, i * e))
+            i += 1
+            w = y
+            g = poly_divmod(g, y)[0]
+        if poly_deg(g) <= 0:
+            break
+        f = poly_sqrt(g)
+        e *= 2
+    return result
+
+
+def distinct_degree_factorization(f):
+    """Пары (g, d): g - произведение всех неприводимых множителей f степени d"""
+    result = []
+    h = 2  # x
+    d = 0
+    while poly_deg(f) >= 2 * (d + 1):
+        d += 1
+        h = poly_mod(poly_square(h), f)  # x^(2^d) mod f
+        g = poly_gcd(h ^ 2, f)
+        if g != 1:
+            result.append((g, d))
+            f = poly_divmod(f, g)[0]
+            h = poly_mod(h, f)
+    if poly_deg(f) > 0:
+        result.append((f, poly_deg(f)))
+    return result
+
+
+def equal_degree_factorization(f, d):
+    """Раскладывает произведение неприводимых многочленов степени d (метод Кантора-Цассенхауза)"""
+    if poly_deg(f) == d:
+        return [f]
+    while True:
+        a = random.getrandbits(poly_deg(f)) | 2
+        # след a + a^2 + ... + a^(2^(d-1)) делит множители f примерно пополам
+        t = a = poly_mod(a, f)
+        for _ in range(d - 1):
+            a = poly_mod(poly_square(a), f)
+            t ^= a
+        g = poly_gcd(t, f)
+        if 0 < poly_deg(g) < poly_deg(f):
+            return equal_degree_factorization(g, d) + equal_degree_factorization(poly_divmod(f, g)[0], d)
+
+
+def factor_poly(f):
+    """Разложение многочлена над GF(2) на неприводимые: {множитель: кратность}"""
+    factors = {}
+    # Множитель x выделяем отдельно
+    while f and not f & 1:
+        factors[2] = factors.get(2, 0) + 1
+        f >>= 1
+    for g, e in squarefree_factorization(f):
+        for h, d in distinct_degree_factorization(g):
+            for p in equal_degree_factorization(h, d):
+                factors[p] = factors.get(p, 0) + e
+    return dict(sorted(factors.items()))
+
+
+def irreducible_order(f):
+    """Порядок x по модулю неприводимого f (f(0) = 1): делитель 2^d - 1"""
+    d = poly_deg(f)
+    order = (1 << d) - 1
+    for p in factorize_mersenne(d):
+        while order % p == 0 and poly_powmod(2, order // p, f) == 1:
+            order //= p
+    return order
+
+
+def _prime_factors_of_period(period, factors):
+    # Простые делители периода известны из разложений 2^d - 1 множителей
+    primes = {2} if period % 2 == 0 else set()
+    for g in factors:
+        primes.update(p for p in factorize_mersenne(poly_deg(g)) if period % p == 0)
+    return sorted(primes)
+
+
+def period_analysis(width, taps, seed=None, form='fibonacci'):
+    """
+    Период регистра по разложению характеристического многочлена.
+    Возвращает словарь:
+      poly        - характеристический многочлен (число),
+      factors     - {неприводимый множитель: кратность},
+      primitive   - многочлен примитивный (период 2^n - 1 для любого ненулевого состояния),
+      period      - наибольший период (порядок x по модулю многочлена без множителя x),
+      preperiod   - число тактов до входа в цикл (ненулевое, если многочлен делится на x),
+      seed_period - период для начального состояния seed (если задано),
+      ones, zeros - число единиц и нулей на периоде для примитивного многочлена и ненулевого seed.
+    """
+    f = characteristic_poly(width, taps, form)
+    factors = factor_poly(f)
+
+    preperiod = factors.get(2, 0)
+    period = 1
+    for g, e in factors.items():
+        if g == 2:
+            continue
+        # Порядок g^e: ord(g) * 2^t, где 2^t - наименьшая степень двойки, не меньшая e
+        order = irreducible_order(g) << (e - 1).bit_length()
+        period = period * order // gcd(period, order)
+
+    primitive = factors == {f: 1} and period == (1 << width) - 1
+
+    result = {
+        'poly': f,
+        'factors': factors,
+        'primitive': primitive,
+        'period': period,
+        'preperiod': preperiod,
+    }
+
+    if seed is not None:
+        result['seed_period'] = seed_period(width, taps, seed, form, period, factors)
+        if primitive and seed & ((1 << width) - 1):
+            result['ones'] = 1 << (width - 1)
+            result['zeros'] = (1 << (width - 1)) - 1
+    return result
+
+
+def seed_period(width, taps, seed, form='fibonacci', period=None, factors=None):
+    """
+    Период выходной последовательности для начального состояния seed: наименьший
+    делитель общего периода, через который состояние повторяется (проверка прыжками).
+    Для регистров с многочленом, делящимся на x, берётся период после предпериода.
+    """
+    if period is None or factors is None:
+        f = characteristic_poly(width, taps, form)
+        factors = factor_poly(f)
+        period = period_analysis(width, taps, None, form)['period']
+
+    start = LFSR(width, taps, seed, form).jump(factors.get(2, 0))
+    state = start.state
+    if state == 0:
+        return 1
+    if len(factors) == 1 and sum(factors.values()) == 1:
+        # Неприводимый многочлен: все ненулевые состояния лежат на циклах одной длины
+        return period
+
+    result = period
+    for p in _prime_factors_of_period(period, factors):
+        while result % p == 0 and start.copy().jump(result // p).state == state:
+            result //= p
+    return result
+
+
+# --- Алгоритм Берлекэмпа-Мэсси ---
+
+class BerlekampMassey(berlekamp_massey.BerlekampMassey):
+    """Алгоритм Берлекэмпа-Мэсси (berlekamp_massey.py) с построением найденного регистра"""
+
+    def to_lfsr(self):
+        """
+        Кратчайший регистр Фибоначчи (класс LFSR), выдающий обработанную последовательность
+        с самого начала (для L = 0 - нулевой регистр ширины 1).
+        """
+        if self.L == 0:
+            return LFSR(1, 0, 0)
+        taps = self.characteristic_poly() & ((1 << self.L) - 1)
+        # Состояние: бит i - s[i]
+        first = self._prefix(self.L)
+        return LFSR(self.L, taps, first)
+
+
+def berlekamp_massey(data):
+    """Линейная сложность и многочлен связи: data - bytes (упакованные биты) или итерация битов"""
+    bm = BerlekampMassey()
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        bm.update_bytes(data)
+    else:
+        bm.update_bits(data)
+    return bm.linear_complexity, bm.connection_poly
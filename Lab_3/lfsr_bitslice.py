@@ -0,0 +1,171 @@
+# Побитно-срезовое (bit-sliced) моделирование регистра сразу для многих начальных состояний
+import argparse
+import time
+
+import numpy as np
+
+from LFSR import TAPS
+
+
+def pack_lanes(bits):  # Массив битов по дорожкам (0/1) -> слова np.uint64, дорожка l - бит l % 64 слова l // 64
+    bits = np.asarray(bits, dtype=np.uint8)
+    pad = -len(bits) % 64
+    if pad:
+        bits = np.concatenate((bits, np.zeros(pad, dtype=np.uint8)))
+    return np.packbits(bits, bitorder='little').view('<u8').astype(np.uint64)
+
+
+def unpack_lanes(words, lanes):  # Обратно: слова np.uint64 -> массив битов длины lanes
+    return np.unpackbits(words.astype('<u8').view(np.uint8), bitorder='little')[:lanes]
+
+
+class BitslicedLFSR:
+    """
+    Много регистров одной конфигурации с разными начальными состояниями.
+    Бит i состояний всех регистров хранится в строке planes[i] (слова np.uint64, по 64 дорожки в слове),
+    поэтому один такт - несколько операций NumPy над строками, одинаковых для всех дорожек.
+    Нумерация битов и формы регистра - как в LFSR.
+    """
+
+    def __init__(self, width=8, taps=TAPS, seeds=None, form='fibonacci'):
+        if form not in ('fibonacci', 'galois'):
+            raise ValueError("form должен быть 'fibonacci' или 'galois'")
+        seeds = np.arange(1 << width, dtype=np.int64) if seeds is None else np.asarray(seeds, dtype=np.int64)
+        self.width = width
+        self.taps = taps
+        self.form = form
+        self.seeds = seeds
+        self.lanes = len(seeds)
+        self.planes = np.array([pack_lanes((seeds >> i) & 1) for i in range(width)])
+        self.tap_rows = [i for i in range(width) if (taps >> i) & 1]
+
+    def step(self):
+        """Один такт всех дорожек, возвращает слова с выходными битами"""
+        planes = self.planes
+        out = planes[0].copy()
+        if self.form == 'fibonacci':
+            fb = np.bitwise_xor.reduce(planes[self.tap_rows], axis=0)
+            planes[:-1] = planes[1:]
+            planes[-1] = fb
+        else:
+            planes[:-1] = planes[1:]
+            planes[-1] = 0
+            for i in self.tap_rows:
+                planes[i] ^= out
+        return out
+
+    def equal_to(self, states):  # Слова, где бит дорожки равен 1, если её состояние совпало с states
+        diff = np.bitwise_or.reduce(self.planes ^ states, axis=0)
+        return ~diff
+
+    def states(self):  # Текущие состояния всех дорожек как int64
+        result = np.zeros(self.lanes, dtype=np.int64)
+        for i in range(self.width):
+            result |= unpack_lanes(self.planes[i], self.lanes).astype(np.int64) << i
+        return result
+
+
+class LaneCounter:
+    """
+    Счётчики по дорожкам в побитно-срезовом виде: planes[j] - бит j всех счётчиков.
+    add(mask) прибавляет 1 дорожкам с битом 1 в mask; перед переполнением счётчики
+    сбрасываются в обычный массив totals.
+    """
+
+    def __init__(self, lanes, nwords, bits=8):
+        self.planes = np.zeros((bits, nwords), dtype=np.uint64)
+        self.totals = np.zeros(lanes, dtype=np.int64)
+        self.lanes = lanes
+        self.limit = (1 << bits) - 1
+        self.pending = 0
+
+    def add(self, mask):
+        carry = mask
+        for plane in self.planes:
+            plane ^= carry
+            carry = carry & ~plane  # перенос там, где бит был 1 и стал 0
+            if not carry.any():
+                break
+        self.pending += 1
+        if self.pending == self.limit:
+            self.flush()
+
+    def flush(self):
+        for j, plane in enumerate(self.planes):
+            self.totals += unpack_lanes(plane, self.lanes).astype(np.int64) << j
+        self.planes[:] = 0
+        self.pending = 0
+        return self.totals
+
+
+def seed_statistics(width=8, taps=TAPS, seeds=None, form='fibonacci', max_steps=None):
+    """
+    Статистика main_func для каждого начального состояния за один векторный прогон:
+    регистр тактуется, пока состояние не вернётся к начальному (не дольше max_steps тактов).
+    Возвращает словарь массивов по дорожкам: seeds, period (-1, если не вернулся за max_steps),
+    zeros/ones (func_conciders), even/odd (count_ch - байты гаммы с младшим битом 0).
+    """
+    reg = BitslicedLFSR(width, taps, seeds, form)
+    lanes = reg.lanes
+    nwords = reg.planes.shape[1]
+    max_steps = max_steps or (1 << width)
+    start_states = reg.planes.copy()
+
+    active = pack_lanes(np.ones(lanes, dtype=np.uint8))
+    period = np.full(lanes, -1, dtype=np.int64)
+    zeros = LaneCounter(lanes, nwords)
+    even = LaneCounter(lanes, nwords)
+
+    for t in range(max_steps):
+        out = reg.step()
+        zero = ~out & active
+        zeros.add(zero)
+        if t % 8 == 7:  # последний бит очередного байта гаммы
+            even.add(zero)
+        done = reg.equal_to(start_states) & active
+        if done.any():
+            period[unpack_lanes(done, lanes).astype(bool)] = t + 1
+            active &= ~done
+            if not active.any():
+                break
+
+    zeros, even = zeros.flush(), even.flush()
+    length = np.where(period > 0, period, max_steps)
+    return {
+        'seeds': reg.seeds,
+        'period': period,
+        'zeros': zeros,
+        'ones': length - zeros,
+        'even': even,
+        'odd': length // 8 - even,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Перебор всех начальных состояний регистра")
+    parser.add_argument('--width', type=int, default=8, help="разрядность регистра")
+    parser.add_argument('--taps', type=lambda s: int(s, 0), default=TAPS, help="маска отводов (например 0x85)")
+    parser.add_argument('--form', default='fibonacci', choices=['fibonacci', 'galois'])
+    parser.add_argument('--top', type=int, default=10, help="сколько лучших состояний показать")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    stats = seed_statistics(args.width, args.taps, form=args.form)
+    elapsed = time.perf_counter() - start
+
+    periods, counts = np.unique(stats['period'], return_counts=True)
+    print(f"Состояний: {len(stats['seeds'])}, время: {elapsed:.2f} с")
+    for p, c in zip(periods, counts):
+        print(f"Период {p}: {c} состояний")
+
+    # Лучшие состояния: наибольший период, затем наименьший перекос нулей/единиц и чётных/нечётных байтов
+    order = np.lexsort((np.abs(stats['even'] - stats['odd']), np.abs(stats['zeros'] - stats['ones']),
+                        -stats['period']))
+    print("Состояние".ljust(12), "||", "Период".center(8), "||", "Нули/единицы".center(14), "||", "Чёт/нечёт")
+    for i in order[:args.top]:
+        print(f"{stats['seeds'][i]:0{args.width}b}".ljust(12), "||", f"{stats['period'][i]}".center(8), "||",
+              f"{stats['zeros'][i]}/{stats['ones'][i]}".center(14), "||", f"{stats['even'][i]}/{stats['odd'][i]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,27 +5,82 @@ Alfavit = {'А': 10, 'Б': 11, 'В': 12, 'Г': 13, 'Д': 14, 'Е': 15, 'Ж': 16,
 Alf_2 = {v: k for k, v in Alfavit.items()}
 
 
+class AlphabetCodec:
+    """
+    Перевод текста в числа и обратно: каждой букве алфавита соответствует двузначный код (10-99).
+    Таблицы строятся один раз:
+    encode - str.translate за один проход (буква -> код, остальные символы не меняются),
+    decode - строка из пар цифр за один проход через массив, индекс в котором считается по байтам пары,
+    digits_to_text - цепочка str.replace по всем кодам (проход на каждый код), как в num_to_text_enc.
+    """
+
+    def __init__(self, alphabet):
+        if not all(10 <= code <= 99 for code in alphabet.values()):
+            raise ValueError("Коды алфавита должны быть двузначными")
+        self.alphabet = alphabet
+        self._encode = str.maketrans({letter: str(code) for letter, code in alphabet.items()})
+        # Пара байтов ASCII (x, y) -> элемент 128 * x + y; для пар, не являющихся кодом, - None
+        self._decode = [None] * (128 * 128)
+        for letter, code in alphabet.items():
+            self._decode[(ord(str(code)[0]) << 7) | ord(str(code)[1])] = letter
+        self._letters = {str(code): letter for letter, code in alphabet.items()}
+        # Замены для digits_to_text в порядке ключей Alf_2: раньше заменённый код имеет приоритет
+        self._replacements = list(self._letters.items())
+
+    def encode(self, text):  # Буквы -> коды
+        return text.translate(self._encode)
+
+    def decode(self, digits):  # Строка двузначных кодов -> буквы (KeyError для неизвестного кода)
+        data = digits.encode('ascii', 'replace')  # символы не из ASCII становятся '?' и кодом не считаются
+        letters = [self._decode[(x << 7) | y] for x, y in zip(data[::2], data[1::2])]
+        if len(data) % 2 or None in letters:
+            raise KeyError(self._first_invalid(digits))
+        return ''.join(letters)
+
+    def _first_invalid(self, digits):  # Первая пара, которая не является кодом
+        for i in range(0, len(digits), 2):
+            if digits[i:i + 2] not in self._letters:
+                return digits[i:i + 2]
+
+    def encode_iter(self, chunks):  # Потоковое encode: куски текста -> куски кодов
+        for chunk in chunks:
+            yield chunk.translate(self._encode)
+
+    def decode_iter(self, chunks):  # Потоковое decode: пара цифр может разрываться между кусками
+        rest = ''
+        for chunk in chunks:
+            chunk = rest + chunk
+            cut = len(chunk) - len(chunk) % 2
+            rest = chunk[cut:]
+            if cut:
+                yield self.decode(chunk[:cut])
+        if rest:
+            yield self.decode(rest)
+
+    def digits_to_text(self, text):
+        """
+        Замена кодов буквами в произвольной строке цифр, как в num_to_text_enc: text.replace по всем
+        кодам в порядке Alf_2. Каждая замена - один проход str.replace на C, что для алфавита
+        из 33 кодов быстрее разбора строки в Python.
+        """
+        for code, letter in self._replacements:
+            text = text.replace(code, letter)
+        return text
+
+
+codec = AlphabetCodec(Alfavit)
+
+
 def num_to_text_enc(text):  # Преобразование из чисел в буквы
-    for key in Alf_2.keys():
-        text = text.replace(str(key), str(Alf_2[key]))
-    return text
+    return codec.digits_to_text(text)
 
 
 def num_to_text_dec(str_num):
-    text = ""
-    for i in range(0, len(str_num), 2):
-        text += Alf_2[int(str_num[i: i + 2])]
-    return text
+    return codec.decode(str_num)
 
 
 def list_to_str(l):  # Преобразование массива в строку чисел
-    lst = list(map(str, l))
-    string = ''
-
-    for element in lst:
-        string += str(element)  # Превращаем каждый элемент списка в строку
-
-    return string
+    return ''.join(map(str, l))
 
 
 def multiplicative_inverse(a, b):  # Расширенный алгоритм Евклида для нахождения e
@@ -48,18 +103,11 @@ def multiplicative_inverse(a, b):  # Расширенный алгоритм Е
 
 
 def text_to_num_3(text):
-    for key in Alfavit.keys():
-        text = text.replace(key, str(Alfavit[key]))
-    return text
+    return codec.encode(text)
 
 def num_to_text_2(text):
-    decrypted_text = ''.join([Alf_2[int(text[i:i + 2])] for i in range(0, len(text), 2)])
-    return decrypted_text
-    print("Расшифрованный текст:", decrypted_text)
+    return codec.decode(text)
 
 def num_to_text(text):  # Преобразование из чисел в буквы
-    Alf_2 = {v: k for k, v in Alfavit.items()}
-    for key in Alf_2.keys():
-        text = text.replace(str(key), str(Alf_2[key]))
-    return text
+    return codec.digits_to_text(text)
 
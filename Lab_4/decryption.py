@@ -1,14 +1,32 @@
 import blocks as bl
 import assistant_functions as af
+import rsa_batch
 
 
-def dec(d, n, text):  # Дешифрование
+def crt_key(d, p, q):  # Закрытый ключ в форме КТО: n = p * q, dp = d mod (p - 1), dq = d mod (q - 1), qinv = q^-1 mod p
+    return {'n': p * q, 'p': p, 'q': q, 'dp': d % (p - 1), 'dq': d % (q - 1),
+            'qinv': af.multiplicative_inverse(q, p)}
+
+
+def dec_block(c, key):  # Расшифрование блока двумя возведениями в степень половинного размера (формула Гарнера)
+    m1 = pow(c, key['dp'], key['p'])
+    m2 = pow(c, key['dq'], key['q'])
+    h = key['qinv'] * (m1 - m2) % key['p']
+    return m2 + h * key['q']
+
+
+def dec(d, n, text, p=None, q=None, workers=1):
+    # Дешифрование; если известны множители p и q модуля - по КТО, workers > 1 - блоки делятся между процессами
 
-    M = []
     C = bl.dec_blocks(text, n)
     print(f"Блоки зашифрованные = {C}")
-    for i in range(len(C)):
-        M.append((pow(C[i], d) % n))
+    if p and q:
+        if p * q != n:
+            raise ValueError("p * q не равно модулю n")
+        key = crt_key(d, p, q)
+        M = rsa_batch.map_blocks(dec_block, C, (key,), workers)
+    else:
+        M = rsa_batch.map_blocks(pow, C, (d, n), workers)
 
     print(f"Блоки дешифрованные = {M}")
     M_str = af.list_to_str(M)
@@ -1,14 +1,13 @@
 import blocks as bl
 import assistant_functions as af
+import rsa_batch
 
 
-def enc(e, n, text):  # Шифрование
+def enc(e, n, text, workers=1):  # Шифрование; workers > 1 - блоки делятся между процессами
 
-    C = []
     M = bl.enc_blocks(text, n)
     print(f"Блоки первоначального текста = {M}")
-    for i in range(len(M)):
-        C.append((pow(M[i],e)) % n)
+    C = rsa_batch.map_blocks(pow, M, (e, n), workers)  # Возведение в степень по модулю, без промежуточного M^e
     print(f"Зашифрованный блоки = {C}")
     C_str = af.list_to_str(C)
     C_text = af.num_to_text_enc(C_str)
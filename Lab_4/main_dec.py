@@ -1,12 +1,13 @@
 import decryption
 
 e, n, d = 51173, 84671, 66677
+p, q = 227, 373  # Множители модуля n для расшифрования по КТО
 
 
-def main_dec(d, n):
+def main_dec(d, n, p=None, q=None):
     enc_blocks = "Н4ОН4ОН4ОН4ОН4ОН4О65645468544ЦЖЗ483"
-    M = decryption.dec(d, n, enc_blocks)
+    M = decryption.dec(d, n, enc_blocks, p, q)
     print(f"Расшифрованное сообщение = {M}")
 
 
-main_dec(d, n)
+main_dec(d, n, p, q)
@@ -0,0 +1,26 @@
+# Пакетная обработка блоков RSA: длинные списки блоков делятся между процессами
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+MIN_PARALLEL = 64  # Меньше блоков обрабатываются в текущем процессе: запуск пула дороже
+
+
+def _apply_chunk(func, chunk, args):  # Обработка части блоков в процессе пула
+    return [func(x, *args) for x in chunk]
+
+
+def map_blocks(func, blocks, args=(), workers=None, min_parallel=MIN_PARALLEL):
+    """
+    [func(block, *args) for block in blocks] в пуле из workers процессов (по умолчанию по числу ядер).
+    func должна быть функцией уровня модуля (pow, decryption.dec_block). Блоки делятся на части
+    по порядку, результаты собираются в том же порядке. Небольшие списки считаются без пула.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(blocks) < min_parallel:
+        return _apply_chunk(func, blocks, args)
+
+    size = -(-len(blocks) // (4 * workers))  # по несколько частей на процесс, чтобы выровнять нагрузку
+    chunks = [blocks[i:i + size] for i in range(0, len(blocks), size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = pool.map(_apply_chunk, [func] * len(chunks), chunks, [args] * len(chunks))
+        return [x for part in parts for x in part]
@@ -1,50 +1,31 @@
+from crc import crc_str, poly_division_str
+from crc_analysis import collision_census, crc_function
+
+
 def binary_xor(bin1, bin2):
     # XOR двух бинарных строк
     return ''.join('1' if a != b else '0' for a, b in zip(bin1, bin2))
 
 
 def poly_division(dividend, divisor):
-    # Функция для деления многочленов
-    while len(dividend) >= len(divisor):
+    # Функция для деления многочленов, остаток фиксированной ширины (степень делителя)
+    return poly_division_str(dividend, divisor)
 
-        if dividend[0] == '0':
-            dividend = dividend[1:]
-            continue
 
-        # Получение степени многочлена
-        degree_diff = len(dividend) - len(divisor)
-
-        # XOR многочленов
-        dividend = binary_xor(dividend, divisor + '0' * degree_diff)
+def crc_remainder(data, polynom):
+    # Вычисление остатка CRC
+    return crc_str(data, polynom, len(polynom))
 
-    # Остаток - оставшийся многочлен после деления
-    remainder = dividend
-    return remainder
 
+# Функция для вычисления коллизий CRC по всем nbits-битовым числам
+def find_crc_collisions(polynom, nbits=8):
+    width = len(polynom) - 1
+    # Перепись через линейность CRC: корзины считаются без перебора всех чисел
+    _, buckets = collision_census(polynom, nbits, crc_function(polynom, len(polynom)))
 
-def crc_remainder(data, polynom):
-    # Вычисление остатка CRC
-    dividend = data + '0' * (len(polynom))
-    remainder = poly_division(dividend, polynom)
-    return remainder
-
-
-# Функция для вычисления коллизий CRC
-def find_crc_collisions(polynom):
-    # Словарь для хранения хешей и соответствующих чисел
-    hashes = {}
-
-    # Перебираем числа от 0 до 255
-    for i in range(256):
-        # Преобразуем число в бинарную строку
-        number_str = bin(i)[2:].zfill(8)
-        # Вычисляем хеш числа
-        hash_value = crc_remainder(number_str, polynom)
-        # Добавляем хеш и число в словарь
-        if hash_value in hashes:
-            hashes[hash_value].append(i)
-        else:
-            hashes[hash_value] = [i]
+    # Словарь хешей в порядке первого встретившегося числа, как при переборе
+    hashes = {format(key, f'0{width}b'): numbers
+              for key, numbers in sorted(buckets.items(), key=lambda item: item[1][0])}
 
     # Находим коллизии
     collisions = {key: value for key, value in hashes.items() if len(value) > 2}
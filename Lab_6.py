@@ -1,28 +1,15 @@
 import random
 
+from crc import CRC, crc_file, crc_str, poly_division_str
+from crc_analysis import iter_crc_preimages
+
 def crc(data, polynom="111"):
     # Вычисление остатка CRC
-    dividend = data + '0' * (len(polynom) - 1)
-    remainder = poly_division(dividend, polynom)
-    return remainder
+    return crc_str(data, polynom)
 
 def poly_division(dividend, divisor):
-    # Функция для деления многочленов
-    while len(dividend) >= len(divisor):
-
-        if dividend[0] == '0':
-            dividend = dividend[1:]
-            continue
-
-        # Получение степени многочлена
-        degree_diff = len(dividend) - len(divisor)
-
-        # XOR многочленов
-        dividend = binary_xor(dividend, divisor + '0' * degree_diff)
-
-    # Остаток - оставшийся многочлен после деления
-    remainder = dividend
-    return remainder
+    # Функция для деления многочленов, остаток фиксированной ширины (степень делителя)
+    return poly_division_str(dividend, divisor)
 
 def binary_xor(bin1, bin2):
     # XOR двух бинарных строк
@@ -43,11 +30,26 @@ def generate_keys(p, g):
     y = pow(g, x, p)
     return x, y
 
-# Функция для подписи сообщения
-def sign_message(message, x, p, g):
+# Хеш сообщения: битовая строка, как раньше, или bytes
+def message_hash(message, polynom="111"):
+    if isinstance(message, str):
+        return int(crc(message, polynom), 2)
+    return CRC(message, poly=polynom).crc_value
+
+# Хеш файла - файл читается блоками, без перевода в битовую строку
+def file_hash(path, polynom="111"):
+    return crc_file(path, CRC(poly=polynom)).crc_value
+
+# Сообщения по шаблону (свободные биты - "?") с тем же хешем, что у message:
+# подпись message подходит и к ним, поэтому это тестовые векторы для подписи
+def colliding_messages(message, template, polynom="111"):
+    return iter_crc_preimages(polynom, int(crc(message, polynom), 2), template)
+
+# Функция для подписи значения хеша
+def sign_hash(h, x, p, g):
     x = 1
     print(f"x = {x}")
-    h = int(crc(message), 2) % (p - 1)
+    h = h % (p - 1)
     k = random.randint(1, p - 1)
     r = pow(g, k, p)
     u = (h - x * r) % (p - 1)
@@ -55,15 +57,31 @@ def sign_message(message, x, p, g):
     s = (k_inv * u) % (p - 1)
     return (r, s)
 
-# Функция для проверки подписи
-def verify_signature(message, signature, y, p, g):
-    h = int(crc(message), 2) % (p - 1)
+# Функция для проверки подписи значения хеша
+def verify_hash(h, signature, y, p, g):
+    h = h % (p - 1)
     r, s = signature
     v1 = pow(y, r, p)
     v2 = pow(r, s, p)
     gh = (v1 * v2) % p
     return gh == pow(g, h, p)
 
+# Функция для подписи сообщения
+def sign_message(message, x, p, g):
+    return sign_hash(message_hash(message), x, p, g)
+
+# Функция для проверки подписи
+def verify_signature(message, signature, y, p, g):
+    return verify_hash(message_hash(message), signature, y, p, g)
+
+# Функция для подписи файла
+def sign_file(path, x, p, g):
+    return sign_hash(file_hash(path), x, p, g)
+
+# Функция для проверки подписи файла
+def verify_file_signature(path, signature, y, p, g):
+    return verify_hash(file_hash(path), signature, y, p, g)
+
 # Генерация параметров
 p, g = 227, 24
 
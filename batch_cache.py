@@ -0,0 +1,56 @@
+# batch_cache.py
+"""
+Долгие переборы с сохранением результатов: оценки считаются порциями в пуле процессов
+и после каждой порции записываются в JSON-файл, поэтому прерванный перебор
+при повторном запуске считает только то, чего ещё нет в файле.
+"""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+def load_json(path):  # Содержимое JSON-файла или пустой словарь, если файла нет
+    if path and os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+
+def save_json(path, data):
+    # Запись через временный файл, чтобы прерванный перебор не портил кэш
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def run_cached_batches(key, items, worker_fn, args=(), item_key=str, workers=None, cache_path=None, batch=256):
+    """
+    Оценивает items порциями по batch: worker_fn(порция, *args) возвращает список оценок
+    в порядке порции. Оценки хранятся в разделе key файла cache_path под именами item_key(item);
+    уже сохранённые не пересчитываются. Возвращает раздел key: {item_key(item): оценка}.
+    """
+    cache = load_json(cache_path)
+    done = cache.setdefault(key, {})
+
+    todo = [item for item in items if item_key(item) not in done]
+    batches = [todo[i:i + batch] for i in range(0, len(todo), batch)]
+    if not batches:
+        return done
+
+    if workers == 1 or len(batches) == 1:
+        results = (worker_fn(b, *args) for b in batches)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = pool.map(worker_fn, batches, *([arg] * len(batches) for arg in args))
+    try:
+        for part, scores in zip(batches, results):
+            for item, score in zip(part, scores):
+                done[item_key(item)] = score
+            if cache_path:
+                save_json(cache_path, cache)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return done
@@ -0,0 +1,113 @@
+# berlekamp_massey.py
+"""
+Алгоритм Берлекэмпа-Мэсси над GF(2): линейная сложность последовательности битов и многочлен связи
+кратчайшего порождающего её регистра. Общее для анализа регистров (Lab_3/lfsr_analysis.py)
+и теста линейной сложности (randomness_tests.py).
+"""
+
+
+class BerlekampMassey:
+    """
+    Инкрементальный алгоритм Берлекэмпа-Мэсси над GF(2).
+
+    Многочлен связи C(x) = 1 + c_1 x + ... + c_L x^L хранится числом (бит i - c_i),
+    последовательность удовлетворяет s[n] = sum c_i * s[n - i]. Последние биты хранятся числом
+    длиной не больше 2L + 64 битов, поэтому невязка считается одним AND и подсчётом единиц
+    за O(L) операций над словами; вся последовательность хранится упакованной в bytearray.
+    """
+
+    def __init__(self):
+        self.c = 1  # текущий многочлен связи
+        self.b = 1  # многочлен связи до последнего изменения L
+        self.L = 0  # линейная сложность
+        self.m = 1  # тактов с последнего изменения L
+        self.n = 0  # обработано битов
+        self.d = 0  # невязка последнего бита
+        self._bytes = bytearray()  # полные байты последовательности, первый бит - старший
+        self._cur = 0  # биты неполного байта
+        self._cur_len = 0
+        self._tail = 0  # последние биты: бит i - s[n - 1 - i]
+        self._tail_mask = (1 << 64) - 1
+
+    def _window(self, k):
+        # Последние k битов из полной записи последовательности: бит i - s[n - 1 - i]
+        if k <= self._cur_len:
+            return self._cur & ((1 << k) - 1)
+        nb = (k - self._cur_len + 7) // 8
+        head = int.from_bytes(self._bytes[-nb:], 'big') if nb else 0
+        return ((head << self._cur_len) | self._cur) & ((1 << k) - 1)
+
+    def update_bit(self, bit):  # Один бит, возвращает невязку
+        return self.update_bits((bit,)).d
+
+    def update_bits(self, bits):
+        """
+        Любая итерация битов 0/1 (например, регистр LFSR); невязка последнего бита - в self.d.
+        Состояние на время цикла держится в локальных переменных.
+        """
+        c, b, L, m, n = self.c, self.b, self.L, self.m, self.n
+        cur, cur_len, tail, tail_mask = self._cur, self._cur_len, self._tail, self._tail_mask
+        cap = tail_mask.bit_length()
+        d = self.d
+        for bit in bits:
+            bit &= 1
+            d = bit ^ (((c >> 1) & tail).bit_count() & 1)
+            if d:
+                if 2 * L <= n:
+                    c, b = c ^ (b << m), c
+                    L = n + 1 - L
+                    m = 1
+                else:
+                    c ^= b << m
+                    m += 1
+            else:
+                m += 1
+
+            n += 1
+            cur = (cur << 1) | bit
+            cur_len += 1
+            if cur_len == 8:
+                self._bytes.append(cur)
+                cur = cur_len = 0
+            if L >= cap:
+                # Окно короче сложности: расширяем и заново берём биты из полной записи
+                cap = 2 * L + 64
+                tail_mask = (1 << cap) - 1
+                self._cur, self._cur_len = cur, cur_len
+                tail = self._window(min(n, cap))
+            else:
+                tail = ((tail << 1) | bit) & tail_mask
+
+        self.c, self.b, self.L, self.m, self.n = c, b, L, m, n
+        self._cur, self._cur_len, self._tail, self._tail_mask = cur, cur_len, tail, tail_mask
+        self.d = d
+        return self
+
+    def update_bytes(self, data):  # Упакованные биты, первый бит - старший бит байта (как LFSR.next_bytes)
+        return self.update_bits(byte >> shift for byte in data for shift in range(7, -1, -1))
+
+    @property
+    def linear_complexity(self):
+        return self.L
+
+    @property
+    def connection_poly(self):
+        return self.c
+
+    def characteristic_poly(self):
+        """Характеристический многочлен x^L * C(1/x) - как у characteristic_poly для регистра Фибоначчи"""
+        return int(format(self.c, f'0{self.L + 1}b')[::-1], 2)
+
+    def _prefix(self, k):
+        # Первые k битов последовательности, бит i - s[i]
+        bits = ''.join(format(b, '08b') for b in self._bytes[:(k + 7) // 8])
+        if len(bits) < k:
+            bits += format(self._cur, f'0{self._cur_len}b') if self._cur_len else ''
+        return int(bits[:k][::-1], 2) if k else 0
+
+
+def linear_complexity(bits):
+    """Линейная сложность последовательности битов (итерация 0/1, например массив NumPy)"""
+    if hasattr(bits, 'tolist'):
+        bits = bits.tolist()  # перебор чисел Python быстрее перебора элементов массива NumPy
+    return BerlekampMassey().update_bits(bits).linear_complexity
@@ -0,0 +1,493 @@
+# crc.py
+"""
+Табличный CRC над bytes/int.
+
+Многочлен задаётся либо строкой битов полного порождающего многочлена ("111", "1011"),
+либо целым числом: полным многочленом (со старшим битом) или, если указана ширина,
+в обычной записи без старшего бита (0x04C11DB7 для CRC-32).
+"""
+import argparse
+import binascii
+import mmap
+import os
+import struct
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from gf2_matrix import GF2MatrixPowers
+
+
+def parse_poly(poly, width=None):
+    """Возвращает (полный многочлен g как int, степень w)"""
+    if isinstance(poly, str):
+        g = int(poly, 2)
+        if width is not None and g.bit_length() == width:
+            g |= 1 << width
+    else:
+        g = int(poly)
+        if width is not None and g.bit_length() <= width:
+            g |= 1 << width
+
+    if g < 2:
+        raise ValueError("Степень порождающего многочлена должна быть не меньше 1")
+
+    w = g.bit_length() - 1
+    if width is not None and width != w:
+        raise ValueError(f"Многочлен {g:#x} не соответствует ширине {width}")
+    return g, w
+
+
+def reflect(value, nbits):
+    """Зеркальное отражение nbits младших битов"""
+    return int(format(value, f'0{nbits}b')[::-1], 2) if nbits else 0
+
+
+def _zlib_crc32(data, reg):
+    # zlib хранит регистр CRC-32 инвертированным
+    return zlib.crc32(data, reg ^ 0xFFFFFFFF) ^ 0xFFFFFFFF
+
+
+class CRCEngine:
+    """
+    Табличный CRC в модели Rocksoft (poly, init, refin, refout, xorout).
+
+    Регистр внутри хранится в том виде, в котором с ним работает табличный алгоритм:
+    для прямого CRC узкие (w < 8) регистры выравниваются по старшему краю байта,
+    для отражённого CRC регистр хранится отражённым.
+    """
+
+    def __init__(self, poly, width=None, init=0, refin=False, refout=False, xorout=0, slices=8):
+        self.poly, self.width = parse_poly(poly, width)
+        self.init = init
+        self.refin = refin
+        self.refout = refout
+        self.xorout = xorout
+        self.slices = slices
+        self.mask = (1 << self.width) - 1
+
+        if refin:
+            self.reg_width = self.width
+            self.pad = 0
+            self.rpoly = reflect(self.poly & self.mask, self.width)
+        else:
+            self.reg_width = max(self.width, 8)
+            self.pad = self.reg_width - self.width
+            self.gpad = self.poly << self.pad
+        self.reg_mask = (1 << self.reg_width) - 1
+
+        self.tables = self._build_tables(slices)
+        self.table = self.tables[0]
+        self._zero_ops = None  # степени оператора нулевого байта для combine
+
+        # Для многочленов, которые умеет стандартная библиотека, регистр считается на C
+        self._native = None
+        if refin and self.poly == 0x104C11DB7:
+            self._native = _zlib_crc32
+        elif not refin and self.poly == 0x11021:
+            self._native = binascii.crc_hqx
+
+    def __repr__(self):
+        return (f"CRCEngine(poly={self.poly:#x}, width={self.width}, init={self.init:#x}, "
+                f"refin={self.refin}, refout={self.refout}, xorout={self.xorout:#x})")
+
+    # --- Построение таблиц ---
+
+    def _build_tables(self, slices):
+        table = [self._step_byte_slow(0, b) for b in range(256)]
+        tables = [table]
+
+        # tables[k][b] - вклад байта b, за которым следуют k нулевых байтов
+        for _ in range(1, max(slices, 1)):
+            prev = tables[-1]
+            tables.append([self._step_table(table, prev[b], 0) for b in range(256)])
+        return tables
+
+    def _step_byte_slow(self, reg, byte):
+        # Побитовая обработка одного байта (используется только для построения таблицы)
+        if self.refin:
+            reg ^= byte
+            for _ in range(8):
+                reg = (reg >> 1) ^ self.rpoly if reg & 1 else reg >> 1
+        else:
+            top = 1 << (self.reg_width - 1)
+            reg ^= byte << (self.reg_width - 8)
+            for _ in range(8):
+                reg = ((reg << 1) ^ self.gpad) & self.reg_mask if reg & top else (reg << 1) & self.reg_mask
+        return reg
+
+    def _step_table(self, table, reg, byte):
+        if self.refin:
+            return (reg >> 8) ^ table[(reg ^ byte) & 0xFF]
+        shift = self.reg_width - 8
+        return ((reg << 8) & self.reg_mask) ^ table[((reg >> shift) ^ byte) & 0xFF]
+
+    # --- Перевод между значением CRC и внутренним регистром ---
+
+    def initial(self):
+        """Начальное значение внутреннего регистра"""
+        return self.to_register(self.init)
+
+    def to_register(self, value):
+        """Значение регистра в обычной записи -> внутренний регистр"""
+        return reflect(value, self.width) if self.refin else value << self.pad
+
+    def from_register(self, reg):
+        """Внутренний регистр -> значение регистра в обычной записи"""
+        return reflect(reg, self.width) if self.refin else reg >> self.pad
+
+    def finalize(self, reg):
+        """Внутренний регистр -> итоговое значение CRC"""
+        value = reg if self.refin else reg >> self.pad
+        if self.refin != self.refout:
+            value = reflect(value, self.width)
+        return value ^ self.xorout
+
+    def unfinalize(self, crc):
+        """Итоговое значение CRC -> внутренний регистр"""
+        value = crc ^ self.xorout
+        if self.refin != self.refout:
+            value = reflect(value, self.width)
+        return value if self.refin else value << self.pad
+
+    # --- Обработка данных ---
+
+    def update(self, reg, data):
+        """Прогоняет bytes-подобные данные через внутренний регистр"""
+        if self._native is not None:
+            return self._native(data, reg)
+        if self.slices >= 8 and len(data) >= 64:
+            return self._update_sliced(reg, data, 8)
+        if self.slices >= 4 and len(data) >= 32:
+            return self._update_sliced(reg, data, 4)
+        return self._update_bytewise(reg, data)
+
+    def _update_bytewise(self, reg, data):
+        table = self.table
+        if self.refin:
+            for b in data:
+                reg = (reg >> 8) ^ table[(reg ^ b) & 0xFF]
+        else:
+            mask = self.reg_mask
+            shift = self.reg_width - 8
+            for b in data:
+                reg = ((reg << 8) & mask) ^ table[(reg >> shift) ^ b]
+        return reg
+
+    def _update_sliced(self, reg, data, n):
+        # Slicing-by-N: за одну итерацию обрабатываются n байтов через n таблиц
+        data = memoryview(data).cast('B')
+        tail = len(data) % n
+        body = data[:len(data) - tail]
+        fmt = '<Q' if self.refin else '>Q'
+        if n == 4:
+            fmt = fmt[0] + 'I'
+
+        bits = 8 * n
+        t = self.tables[:n][::-1]  # t[k] - таблица для k-го байта слова
+        width = self.reg_width
+
+        if self.refin:
+            if n == 8:
+                t0, t1, t2, t3, t4, t5, t6, t7 = t
+                for (word,) in struct.iter_unpack(fmt, body):
+                    v = reg ^ word
+                    reg = ((v >> 64) ^ t0[v & 0xFF] ^ t1[(v >> 8) & 0xFF] ^ t2[(v >> 16) & 0xFF]
+                           ^ t3[(v >> 24) & 0xFF] ^ t4[(v >> 32) & 0xFF] ^ t5[(v >> 40) & 0xFF]
+                           ^ t6[(v >> 48) & 0xFF] ^ t7[(v >> 56) & 0xFF])
+            else:
+                t0, t1, t2, t3 = t
+                for (word,) in struct.iter_unpack(fmt, body):
+                    v = reg ^ word
+                    reg = ((v >> 32) ^ t0[v & 0xFF] ^ t1[(v >> 8) & 0xFF] ^ t2[(v >> 16) & 0xFF]
+                           ^ t3[(v >> 24) & 0xFF])
+        elif width <= bits:
+            # Регистр целиком помещается в слово: складываем его со старшими битами слова
+            up = bits - width
+            if n == 8:
+                t7, t6, t5, t4, t3, t2, t1, t0 = t
+                for (word,) in struct.iter_unpack(fmt, body):
+                    v = word ^ (reg << up)
+                    reg = (t0[v & 0xFF] ^ t1[(v >> 8) & 0xFF] ^ t2[(v >> 16) & 0xFF] ^ t3[(v >> 24) & 0xFF]
+                           ^ t4[(v >> 32) & 0xFF] ^ t5[(v >> 40) & 0xFF] ^ t6[(v >> 48) & 0xFF]
+                           ^ t7[v >> 56])
+            else:
+                t3, t2, t1, t0 = t
+                for (word,) in struct.iter_unpack(fmt, body):
+                    v = word ^ (reg << up)
+                    reg = t0[v & 0xFF] ^ t1[(v >> 8) & 0xFF] ^ t2[(v >> 16) & 0xFF] ^ t3[v >> 24]
+        else:
+            # Широкий регистр: старшие биты складываются со словом, младшие сдвигаются дальше
+            low_bits = width - bits
+            low_mask = (1 << low_bits) - 1
+            mask = self.reg_mask
+            r = t[::-1]  # r[k] - таблица для k-го байта слова, считая от младшего
+            for (word,) in struct.iter_unpack(fmt, body):
+                v = word ^ (reg >> low_bits)
+                acc = ((reg & low_mask) << bits) & mask
+                for k in range(n):
+                    acc ^= r[k][(v >> (8 * k)) & 0xFF]
+                reg = acc
+
+        return self._update_bytewise(reg, data[len(data) - tail:])
+
+    def update_bits(self, reg, value, nbits):
+        """
+        Прогоняет через регистр сообщение из nbits битов, заданное числом.
+        Для прямого CRC биты идут от старшего к младшему, для отражённого - от младшего.
+        """
+        head = nbits % 8
+        nbytes = nbits // 8
+
+        if self.refin:
+            reg = self.update(reg, (value & ((1 << (8 * nbytes)) - 1)).to_bytes(nbytes, 'little'))
+            value >>= 8 * nbytes
+            for _ in range(head):
+                reg ^= value & 1
+                value >>= 1
+                reg = (reg >> 1) ^ self.rpoly if reg & 1 else reg >> 1
+            return reg
+
+        top = 1 << (self.reg_width - 1)
+        for i in range(head - 1, -1, -1):
+            if (value >> (8 * nbytes + i)) & 1:
+                reg ^= top
+            reg = ((reg << 1) ^ self.gpad) & self.reg_mask if reg & top else (reg << 1) & self.reg_mask
+        return self.update(reg, (value & ((1 << (8 * nbytes)) - 1)).to_bytes(nbytes, 'big'))
+
+    def checksum(self, data):
+        """CRC от bytes-подобных данных"""
+        return self.finalize(self.update(self.initial(), data))
+
+    def checksum_bits(self, value, nbits):
+        """CRC от битового сообщения длины nbits, заданного числом"""
+        return self.finalize(self.update_bits(self.initial(), value, nbits))
+
+    # --- Склейка CRC ---
+
+    def params(self):
+        """Параметры для get_engine (например, для передачи в другой процесс)"""
+        return self.poly, self.width, self.init, self.refin, self.refout, self.xorout, self.slices
+
+    def shift(self, reg, nbytes):
+        """Регистр после прогона nbytes нулевых байтов: умножение на степень матрицы сдвига"""
+        if self._zero_ops is None:
+            # Оператор одного нулевого байта: столбец j - образ регистра с единственным битом j
+            self._zero_ops = GF2MatrixPowers([self._step_table(self.table, 1 << j, 0) for j in range(self.reg_width)])
+        return self._zero_ops.times(reg, nbytes)
+
+    def combine(self, crc_a, crc_b, len_b):
+        """CRC склейки A+B по CRC частей и длине B в байтах"""
+        reg_a = self.unfinalize(crc_a) ^ self.initial()
+        return self.finalize(self.shift(reg_a, len_b) ^ self.unfinalize(crc_b))
+
+
+@lru_cache(maxsize=64)
+def get_engine(poly, width=None, init=0, refin=False, refout=False, xorout=0, slices=8):
+    """Кэшированный движок - таблицы строятся один раз на набор параметров"""
+    return CRCEngine(poly, width, init, refin, refout, xorout, slices)
+
+
+# Распространённые наборы параметров
+PRESETS = {
+    'CRC-8': dict(poly=0x07, width=8),
+    'CRC-16/ARC': dict(poly=0x8005, width=16, refin=True, refout=True),
+    'CRC-16/CCITT-FALSE': dict(poly=0x1021, width=16, init=0xFFFF),
+    'CRC-32': dict(poly=0x04C11DB7, width=32, init=0xFFFFFFFF, refin=True, refout=True, xorout=0xFFFFFFFF),
+    'CRC-32C': dict(poly=0x1EDC6F41, width=32, init=0xFFFFFFFF, refin=True, refout=True, xorout=0xFFFFFFFF),
+    'CRC-64/XZ': dict(poly=0x42F0E1EBA9EA3693, width=64, init=(1 << 64) - 1, refin=True, refout=True,
+                      xorout=(1 << 64) - 1),
+}
+
+
+def preset_engine(name):
+    return get_engine(**PRESETS[name])
+
+
+def crc_combine(crc_a, crc_b, len_b, engine=None):
+    """
+    CRC конкатенации A+B по crc_a = CRC(A), crc_b = CRC(B) и длине B в байтах
+    (как crc32_combine в zlib). По умолчанию - CRC-32.
+    """
+    if engine is None:
+        engine = preset_engine('CRC-32')
+    return engine.combine(crc_a, crc_b, len_b)
+
+
+# --- Функции для битовых строк, как в лабораторных ---
+
+def poly_mod_bits(value, nbits, poly):
+    """Остаток от деления битового многочлена value (nbits битов) на порождающий многочлен"""
+    engine = get_engine(poly)
+    w = engine.width
+    if nbits <= w:
+        return value
+    # value = hi * x^w + lo, а hi * x^w mod g - это обычный CRC от hi
+    hi_bits = nbits - w
+    return engine.checksum_bits(value >> w, hi_bits) ^ (value & engine.mask)
+
+
+def crc_str(data, poly, extra_zeros=None):
+    """
+    Остаток от деления data * x^extra_zeros на poly, где data и poly - битовые строки.
+    По умолчанию extra_zeros равно степени многочлена (классический CRC).
+    Результат - строка фиксированной ширины (степень многочлена).
+    """
+    engine = get_engine(poly)
+    if extra_zeros is None:
+        extra_zeros = engine.width
+    value = (int(data, 2) if data else 0) << extra_zeros
+    return format(poly_mod_bits(value, len(data) + extra_zeros, poly), f'0{engine.width}b')
+
+
+def poly_division_str(dividend, divisor):
+    """Остаток от деления битовых строк-многочленов (как poly_division в лабораторных)"""
+    if len(dividend) < len(divisor):
+        return dividend
+    width = len(divisor) - 1
+    return format(poly_mod_bits(int(dividend, 2), len(dividend), divisor), f'0{width}b')
+
+
+# --- Потоковый объект в стиле hashlib ---
+
+class CRC:
+    """
+    Инкрементальный CRC с интерфейсом hashlib: update(), copy(), digest(), hexdigest().
+    Параметры те же, что у CRCEngine; вместо них можно передать готовый движок.
+    """
+
+    def __init__(self, data=b'', poly='111', width=None, init=0, refin=False, refout=False, xorout=0,
+                 engine=None):
+        self.engine = engine or get_engine(poly, width, init, refin, refout, xorout)
+        self.digest_size = (self.engine.width + 7) // 8
+        self._reg = self.engine.initial()
+        if data:
+            self.update(data)
+
+    @classmethod
+    def preset(cls, name, data=b''):
+        return cls(data, engine=preset_engine(name))
+
+    def update(self, data):
+        self._reg = self.engine.update(self._reg, data)
+
+    def update_bits(self, value, nbits):
+        """Дописывает битовое сообщение, заданное числом"""
+        self._reg = self.engine.update_bits(self._reg, value, nbits)
+
+    def copy(self):
+        other = CRC.__new__(CRC)
+        other.engine = self.engine
+        other.digest_size = self.digest_size
+        other._reg = self._reg
+        return other
+
+    @property
+    def crc_value(self):
+        return self.engine.finalize(self._reg)
+
+    def digest(self):
+        return self.crc_value.to_bytes(self.digest_size, 'big')
+
+    def hexdigest(self):
+        return self.digest().hex()
+
+
+def crc_file(path, crc=None, chunk_size=1 << 20, use_mmap=False):
+    """
+    CRC файла при постоянном расходе памяти: файл читается блоками по chunk_size
+    или отображается в память через mmap. Возвращает объект CRC.
+    """
+    if crc is None:
+        crc = CRC.preset('CRC-32')
+
+    with open(path, 'rb') as f:
+        if use_mmap and os.fstat(f.fileno()).st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    for start in range(0, len(view), chunk_size):
+                        crc.update(view[start:start + chunk_size])
+                finally:
+                    view.release()
+        else:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                crc.update(chunk)
+
+    return crc
+
+
+# --- Параллельный подсчёт CRC больших файлов ---
+
+def _crc_file_range(path, start, length, params, chunk_size):
+    # CRC участка файла, считается в отдельном процессе
+    engine = get_engine(*params)
+    reg = engine.initial()
+    with open(path, 'rb') as f:
+        f.seek(start)
+        while length > 0:
+            chunk = f.read(min(chunk_size, length))
+            if not chunk:
+                break
+            reg = engine.update(reg, chunk)
+            length -= len(chunk)
+    return engine.finalize(reg)
+
+
+def crc_file_parallel(path, workers=None, engine=None, chunk_size=1 << 20, min_part=1 << 22):
+    """
+    CRC файла, посчитанный по частям в пуле процессов и склеенный через crc_combine.
+    Небольшие файлы считаются в текущем процессе.
+    """
+    if engine is None:
+        engine = preset_engine('CRC-32')
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(path)
+
+    if workers == 1 or size < 2 * min_part:
+        return crc_file(path, CRC(engine=engine), chunk_size).crc_value
+
+    # По несколько частей на процесс, чтобы выровнять нагрузку
+    parts = min(workers * 4, size // min_part)
+    step = -(-size // parts)
+    ranges = [(start, min(step, size - start)) for start in range(0, size, step)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_crc_file_range, path, start, length, engine.params(), chunk_size)
+                   for start, length in ranges]
+        result = None
+        for (_, length), future in zip(ranges, futures):
+            value = future.result()
+            result = value if result is None else engine.combine(result, value, length)
+
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Параллельный подсчёт CRC файла")
+    parser.add_argument('path', help="файл")
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count(), help="число процессов")
+    parser.add_argument('--preset', default='CRC-32', choices=sorted(PRESETS), help="набор параметров CRC")
+    parser.add_argument('--poly', help="порождающий многочлен битовой строкой (вместо --preset)")
+    parser.add_argument('--chunk-size', type=int, default=1 << 20, help="размер блока чтения в байтах")
+    args = parser.parse_args(argv)
+
+    engine = get_engine(args.poly) if args.poly else preset_engine(args.preset)
+    size = os.path.getsize(args.path)
+
+    start = time.perf_counter()
+    value = crc_file_parallel(args.path, args.workers, engine, args.chunk_size)
+    elapsed = time.perf_counter() - start
+
+    digits = (engine.width + 3) // 4
+    print(f"{value:0{digits}x}  {args.path}")
+    print(f"{size / 2 ** 20:.1f} МБ за {elapsed:.2f} с ({size / 2 ** 20 / max(elapsed, 1e-9):.1f} МБ/с), "
+          f"процессов: {args.workers}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,394 @@
+# crc_analysis.py
+"""
+Анализ CRC через линейность над GF(2).
+
+CRC от n-битового сообщения - аффинная функция: crc(v) = c0 ^ L(v), где c0 - CRC нулевого
+сообщения, а L - линейное отображение, заданное вкладами отдельных битов. Поэтому коллизии
+образуют смежные классы ядра L, и их можно перечислять без перебора всех 2^n сообщений.
+"""
+import argparse
+import math
+
+from batch_cache import run_cached_batches
+from crc import get_engine, poly_mod_bits
+
+
+def crc_function(poly, extra_zeros=None):
+    """
+    Функция (value, nbits) -> CRC для многочлена-строки, как в лабораторных:
+    остаток от деления value * x^extra_zeros на poly (по умолчанию extra_zeros = степень).
+    """
+    if extra_zeros is None:
+        extra_zeros = get_engine(poly).width
+    return lambda value, nbits: poly_mod_bits(value << extra_zeros, nbits + extra_zeros, poly)
+
+
+def crc_basis(crc_func, nbits):
+    """
+    Возвращает (c0, basis): c0 - CRC нулевого сообщения,
+    basis[i] - вклад бита i сообщения (CRC(2^i) ^ c0).
+    """
+    c0 = crc_func(0, nbits)
+    basis = [crc_func(1 << i, nbits) ^ c0 for i in range(nbits)]
+    return c0, basis
+
+
+def gf2_eliminate(vectors):
+    """
+    Гауссово исключение над GF(2).
+    Возвращает (rows, kernel):
+      rows   - список (вектор, маска), где вектор - базис образа с различными старшими битами,
+               а маска - набор исходных векторов, сумма которых его даёт;
+      kernel - маски линейных комбинаций, дающих ноль (базис ядра).
+    """
+    pivots = {}  # старший бит -> (вектор, маска)
+    kernel = []
+
+    for i, v in enumerate(vectors):
+        mask = 1 << i
+        while v:
+            top = v.bit_length() - 1
+            if top not in pivots:
+                pivots[top] = (v, mask)
+                break
+            pv, pm = pivots[top]
+            v ^= pv
+            mask ^= pm
+        else:
+            kernel.append(mask)
+
+    rows = [pivots[top] for top in sorted(pivots)]
+    return rows, kernel
+
+
+def gray_span(vectors, start=0):
+    """
+    Перебор всех 2^k сумм векторов в порядке кода Грея -
+    на каждом шаге меняется ровно одно слагаемое.
+    """
+    value = start
+    yield value
+    for i in range(1, 1 << len(vectors)):
+        # номер меняющегося бита в коде Грея - число младших нулей i
+        value ^= vectors[(i & -i).bit_length() - 1]
+        yield value
+
+
+def _census_space(poly, nbits, crc_func):
+    # c0, базис образа, прообразы базисных векторов и базис ядра
+    if crc_func is None:
+        crc_func = crc_function(poly)
+    c0, basis = crc_basis(crc_func, nbits)
+    rows, kernel = gf2_eliminate(basis)
+    return c0, [v for v, _ in rows], [m for _, m in rows], kernel
+
+
+def iter_crc_buckets(poly, nbits, crc_func=None):
+    """
+    Потоковая перепись коллизий: по одному выдаёт пары (crc, members) для всех
+    значений CRC, которые принимают n-битовые сообщения. members - генератор сообщений
+    (как чисел) с этим CRC, каждая корзина содержит 2^(nbits - rank) элементов.
+    """
+    c0, images, preimages, kernel = _census_space(poly, nbits, crc_func)
+    for image, preimage in zip(gray_span(images), gray_span(preimages)):
+        yield c0 ^ image, gray_span(kernel, preimage)
+
+
+def census_histogram(poly, nbits, crc_func=None):
+    """
+    Гистограмма корзин без перечисления сообщений: {размер корзины: число корзин}.
+    Для аффинного CRC все непустые корзины одного размера.
+    """
+    _, images, _, kernel = _census_space(poly, nbits, crc_func)
+    return {1 << len(kernel): 1 << len(images)}
+
+
+def collision_census(poly, nbits, crc_func=None, members=True):
+    """
+    Перепись коллизий CRC по всем nbits-битовым сообщениям.
+    Возвращает (histogram, buckets): histogram - {crc: число сообщений},
+    buckets - {crc: отсортированный список сообщений} (None, если members=False).
+    """
+    if not members:
+        c0, images, _, kernel = _census_space(poly, nbits, crc_func)
+        size = 1 << len(kernel)
+        return {c0 ^ image: size for image in gray_span(images)}, None
+
+    buckets = {value: sorted(bucket) for value, bucket in iter_crc_buckets(poly, nbits, crc_func)}
+    histogram = {value: len(bucket) for value, bucket in buckets.items()}
+    return histogram, buckets
+
+
+# --- Поиск прообразов ---
+
+def gf2_solve(rows, target):
+    """
+    Решает sum(mask-векторов) = target по строкам из gf2_eliminate.
+    Возвращает маску частного решения или None, если решения нет.
+    """
+    mask = 0
+    for v, m in reversed(rows):  # от старших ведущих битов к младшим
+        if target >> (v.bit_length() - 1) & 1:
+            target ^= v
+            mask ^= m
+    return mask if target == 0 else None
+
+
+def parse_template(template, free='?'):
+    """Шаблон вида "10??1?0" -> (значение фиксированных битов, длина, номера свободных битов)"""
+    nbits = len(template)
+    base = int(template.replace(free, '0'), 2) if template else 0
+    positions = [nbits - 1 - i for i, ch in enumerate(template) if ch == free]
+    return base, nbits, positions
+
+
+def iter_crc_preimages(poly, target, template, crc_func=None, free='?'):
+    """
+    Лениво перебирает все сообщения, подходящие под шаблон и имеющие CRC = target.
+    Свободные биты шаблона отмечены символом free. Решение ищется как система линейных
+    уравнений над GF(2), поэтому первое решение находится за полиномиальное время,
+    а каждое следующее - за O(1) в порядке кода Грея.
+    Сообщения выдаются битовыми строками длины шаблона.
+    """
+    if crc_func is None:
+        crc_func = crc_function(poly)
+    base, nbits, positions = parse_template(template, free)
+
+    c0 = crc_func(0, nbits)
+    basis = [crc_func(1 << p, nbits) ^ c0 for p in positions]
+    rows, kernel = gf2_eliminate(basis)
+
+    mask = gf2_solve(rows, target ^ crc_func(base, nbits))
+    if mask is None:
+        return
+
+    def to_message(choice):
+        # Маска над свободными битами -> битовое сообщение
+        value = base
+        for k, p in enumerate(positions):
+            if choice >> k & 1:
+                value |= 1 << p
+        return format(value, f'0{nbits}b') if nbits else ''
+
+    for choice in gray_span(kernel, mask):
+        yield to_message(choice)
+
+
+def crc_preimage(poly, target, template, crc_func=None, free='?'):
+    """Одно сообщение по шаблону с CRC = target или None"""
+    return next(iter_crc_preimages(poly, target, template, crc_func, free), None)
+
+
+# --- Перебор порождающих многочленов ---
+
+def syndromes(poly, length):
+    """Остатки x^i mod g для всех позиций кодового слова длины length"""
+    return [poly_mod_bits(1 << i, i + 1, poly) for i in range(length)]
+
+
+def hamming_distance(poly, nbits, max_weight=4):
+    """
+    Минимальное расстояние Хэмминга кода CRC для сообщений из nbits битов
+    (кодовое слово - nbits + степень битов). Ищутся необнаруживаемые ошибки веса
+    не больше max_weight (до 4) через совпадения синдромов. Если таких нет,
+    возвращается max_weight + 1 - гарантированная нижняя граница.
+    """
+    length = nbits + get_engine(poly).width
+    s = syndromes(poly, length)
+
+    # Вес 1: нулевой синдром
+    if 0 in s:
+        return 1
+    # Вес 2: два одинаковых синдрома
+    if len(set(s)) < len(s):
+        return 2
+    if max_weight < 3:
+        return 3
+
+    # Вес 3: s_i ^ s_j совпадает с третьим синдромом
+    known = set(s)
+    for i in range(length):
+        for j in range(i + 1, length):
+            if s[i] ^ s[j] in known:
+                return 3
+    if max_weight < 4:
+        return 4
+
+    # Вес 4: две пары с одинаковой суммой (пары не пересекаются, иначе нашёлся бы вес 2)
+    seen = set()
+    for i in range(length):
+        for j in range(i + 1, length):
+            x = s[i] ^ s[j]
+            if x in seen:
+                return 4
+            seen.add(x)
+    return 5
+
+
+def poly_score(poly, nbits, extra_zeros=None, max_weight=4):
+    """Оценка одного многочлена: равномерность корзин и расстояние Хэмминга"""
+    width = get_engine(poly).width
+    _, images, _, kernel = _census_space(poly, nbits, crc_function(poly, extra_zeros))
+
+    # Все непустые корзины одного размера, остальные 2^w - 2^rank пусты
+    used = 1 << len(images)
+    size = 1 << len(kernel)
+    buckets = 1 << width
+    expected = (1 << nbits) / buckets
+    chi2 = (used * (size - expected) ** 2 + (buckets - used) * expected ** 2) / expected
+
+    return {
+        'poly': poly,
+        'degree': width,
+        'nbits': nbits,
+        'rank': len(images),
+        'used_buckets': used,
+        'max_bucket': size,
+        'chi2': chi2,
+        'hd': hamming_distance(poly, nbits, max_weight),
+    }
+
+
+def all_polys(max_degree, min_degree=1, odd_only=False):
+    """Все порождающие многочлены степени min_degree..max_degree в виде битовых строк"""
+    for degree in range(min_degree, max_degree + 1):
+        for low in range(1 << degree):
+            if odd_only and not low & 1:
+                continue
+            yield format((1 << degree) | low, 'b')
+
+
+def _score_batch(polys, nbits, extra_zeros, max_weight):
+    return [poly_score(poly, nbits, extra_zeros, max_weight) for poly in polys]
+
+
+def poly_sweep(max_degree, nbits, min_degree=1, odd_only=False, extra_zeros=None, max_weight=4,
+               workers=None, cache_path=None, batch=256):
+    """
+    Перебирает все многочлены до степени max_degree, оценивает каждый на всех
+    nbits-битовых сообщениях и возвращает список оценок, лучшие первыми:
+    большее расстояние Хэмминга, меньшая максимальная корзина, меньший хи-квадрат.
+    Результаты сохраняются в cache_path (JSON), повторный перебор считает только новое.
+    """
+    done = run_cached_batches(f"{nbits}:{extra_zeros}:{max_weight}", all_polys(max_degree, min_degree, odd_only),
+                              _score_batch, (nbits, extra_zeros, max_weight), workers=workers,
+                              cache_path=cache_path, batch=batch)
+    scores = [done[poly] for poly in all_polys(max_degree, min_degree, odd_only)]
+    scores.sort(key=lambda r: (-r['hd'], r['max_bucket'], r['chi2'], r['degree'], r['poly']))
+    return scores
+
+
+# --- Весовой спектр и вероятность необнаруженной ошибки ---
+
+def _span_weights(rows):
+    # Распределение весов линейной оболочки строк (строки - числа-битовые векторы)
+    counts = {}
+    for word in gray_span(rows):
+        weight = word.bit_count()
+        counts[weight] = counts.get(weight, 0) + 1
+    return counts
+
+
+def weight_distribution(poly, nbits):
+    """
+    Весовой спектр кода CRC для сообщений из nbits битов: список A, где A[i] - число
+    кодовых слов веса i (длина кодового слова N = nbits + степень).
+
+    Перебирается меньший из двух кодов: сам код (2^nbits слов) или дуальный (2^степень слов).
+    Слова хранятся как N-битовые числа (по биту на позицию), и в порядке кода Грея каждое
+    следующее получается одним XOR. Спектр по дуальному коду пересчитывается по тождеству
+    Мак-Вильямс через многочлены Кравчука.
+    """
+    width = get_engine(poly).width
+    length = nbits + width
+
+    if nbits <= width:
+        # Порождающая матрица: сдвиги g(x) * x^i
+        g = int(poly, 2) if isinstance(poly, str) else get_engine(poly).poly
+        counts = _span_weights([g << i for i in range(nbits)])
+        return [counts.get(i, 0) for i in range(length + 1)]
+
+    # Проверочная матрица: строка r содержит бит r синдрома x^i mod g для каждой позиции i
+    s = syndromes(poly, length)
+    rows = [sum(1 << i for i in range(length) if s[i] >> r & 1) for r in range(width)]
+    dual = _span_weights(rows)
+
+    # A_i = 2^-w * sum_j B_j * K_i(j), K_i(j) - многочлены Кравчука
+    total = [0] * (length + 1)
+    for j, b in dual.items():
+        k_prev, k = 0, 1  # K_{-1}(j), K_0(j)
+        for i in range(length + 1):
+            total[i] += b * k
+            # (i + 1) K_{i+1} = (N - 2j) K_i - (N - i + 1) K_{i-1}
+            k_prev, k = k, ((length - 2 * j) * k - (length - i + 1) * k_prev) // (i + 1)
+    return [a >> width for a in total]
+
+
+def minimum_distance(poly, nbits, spectrum=None):
+    """Минимальное расстояние кода CRC (по весовому спектру)"""
+    if spectrum is None:
+        spectrum = weight_distribution(poly, nbits)
+    return next((i for i, a in enumerate(spectrum) if i and a), None)
+
+
+def undetected_error_probability(poly, nbits, p, spectrum=None):
+    """
+    Вероятность того, что ошибка в двоичном симметричном канале с вероятностью
+    искажения бита p останется необнаруженной: сумма A_i * p^i * (1 - p)^(N - i), i >= 1.
+    """
+    if spectrum is None:
+        spectrum = weight_distribution(poly, nbits)
+    if p <= 0:
+        return 0.0
+    if p >= 1:
+        return float(spectrum[-1])
+    # Через логарифмы: A_i бывают больше, чем помещается во float
+    length = len(spectrum) - 1
+    log_p, log_q = math.log(p), math.log1p(-p)
+    return sum(math.exp(math.log(a) + i * log_p + (length - i) * log_q)
+               for i, a in enumerate(spectrum) if i and a)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Анализ порождающих многочленов CRC")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    sweep = commands.add_parser('sweep', help="перебор многочленов до заданной степени")
+    sweep.add_argument('--degree', type=int, required=True, help="максимальная степень")
+    sweep.add_argument('--min-degree', type=int, default=1)
+    sweep.add_argument('--nbits', type=int, default=8, help="длина сообщений в битах")
+    sweep.add_argument('--odd-only', action='store_true', help="только многочлены со свободным членом")
+    sweep.add_argument('-j', '--workers', type=int, default=None, help="число процессов")
+    sweep.add_argument('--cache', default=None, help="JSON-файл кэша результатов")
+    sweep.add_argument('--top', type=int, default=20, help="сколько лучших вывести")
+
+    weights = commands.add_parser('weights', help="весовой спектр и вероятность необнаруженной ошибки")
+    weights.add_argument('--poly', required=True, help="порождающий многочлен битовой строкой")
+    weights.add_argument('--nbits', type=int, required=True, help="длина сообщений в битах")
+    weights.add_argument('-p', '--ber', type=float, action='append', help="вероятность ошибки бита")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'sweep':
+        scores = poly_sweep(args.degree, args.nbits, args.min_degree, args.odd_only,
+                            workers=args.workers, cache_path=args.cache)
+        print("Многочлен".ljust(args.degree + 2), "||", "HD", "||", "Макс. корзина", "||", "Хи-квадрат")
+        for r in scores[:args.top]:
+            hd = f">={r['hd']}" if r['hd'] > 4 else str(r['hd'])
+            print(r['poly'].ljust(args.degree + 2), "||", hd.rjust(3), "||",
+                  str(r['max_bucket']).rjust(13), "||", f"{r['chi2']:.2f}")
+
+    elif args.command == 'weights':
+        spectrum = weight_distribution(args.poly, args.nbits)
+        print(f"Длина кодового слова: {len(spectrum) - 1}")
+        print(f"Минимальное расстояние: {minimum_distance(args.poly, args.nbits, spectrum)}")
+        print("Вес || Число кодовых слов")
+        for i, a in enumerate(spectrum):
+            if a:
+                print(f"{i}".ljust(3), "||", a)
+        for p in args.ber or [1e-3, 1e-5]:
+            print(f"P(необнаруженной ошибки), p = {p:g}: {undetected_error_probability(args.poly, args.nbits, p, spectrum):.6e}")
+
+
+if __name__ == '__main__':
+    main()
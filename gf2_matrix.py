@@ -0,0 +1,51 @@
+# gf2_matrix.py
+"""
+Матрицы над GF(2): матрица - список столбцов-чисел, вектор - число (бит i - координата i).
+Общее для прыжков CRC (crc.py) и регистров сдвига (Lab_3/LFSR.py).
+"""
+
+
+def gf2_matrix_times(mat, vec):
+    """Умножение матрицы над GF(2) (список столбцов-чисел) на вектор-число"""
+    result = 0
+    i = 0
+    while vec:
+        if vec & 1:
+            result ^= mat[i]
+        vec >>= 1
+        i += 1
+    return result
+
+
+def gf2_matrix_square(mat):
+    """Квадрат матрицы над GF(2)"""
+    return [gf2_matrix_times(mat, column) for column in mat]
+
+
+class GF2MatrixPowers:
+    """
+    Степени M, M^2, M^4, ... матрицы над GF(2), дополняемые по мере надобности.
+    Новые степени считаются в локальной копии, после чего кортеж степеней подменяется целиком,
+    поэтому один объект (например, из lru_cache) можно использовать из нескольких потоков.
+    """
+
+    def __init__(self, mat):
+        self.powers = (mat,)
+
+    def times(self, vec, n):
+        """M^n * vec за O(log n) умножений"""
+        powers = self.powers
+        if n.bit_length() > len(powers):
+            grown = list(powers)
+            while len(grown) < n.bit_length():
+                grown.append(gf2_matrix_square(grown[-1]))
+            powers = tuple(grown)
+            if len(powers) > len(self.powers):
+                self.powers = powers
+        k = 0
+        while n:
+            if n & 1:
+                vec = gf2_matrix_times(powers[k], vec)
+            n >>= 1
+            k += 1
+        return vec
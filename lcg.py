@@ -0,0 +1,349 @@
+# lcg.py
+"""
+Линейный конгруэнтный генератор x -> (a * x + c) mod m с прыжком вперёд за O(log n)
+и аналитическим вычислением периода (без перебора, как в Lab_1.py).
+
+Период считается по разложению m на степени простых p^e: по китайской теореме об остатках
+период равен НОК периодов по модулям p^e, а предпериод - максимуму предпериодов.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from math import gcd, isqrt, lcm
+
+import numpy as np
+
+from numtheory import factorize
+
+
+def valuation(n, p):  # Показатель степени p в n (для n = 0 - бесконечность)
+    if n == 0:
+        return float('inf')
+    v = 0
+    while n % p == 0:
+        n //= p
+        v += 1
+    return v
+
+
+def parse_int(text):  # Число: 137, 0x89 или степень 2^64
+    if '^' in text:
+        base, exp = text.split('^')
+        return int(base, 0) ** int(exp, 0)
+    return int(text, 0)
+
+
+# --- Аффинные отображения ---
+
+def affine_power(a, c, n, m):
+    """
+    n-я степень отображения x -> a * x + c по модулю m: пара (A, C), для которой x_n = A * x_0 + C.
+    Двоичное возведение в степень с композицией (a1, c1) * (a2, c2) = (a1 * a2, a1 * c2 + c1).
+    """
+    A, C = 1 % m, 0
+    a, c = a % m, c % m
+    while n:
+        if n & 1:
+            A, C = A * a % m, (a * C + c) % m
+        a, c = a * a % m, (a * c + c) % m
+        n >>= 1
+    return A, C
+
+
+def multiplicative_order(a, p, e):
+    """Порядок a по модулю p^e (a не делится на p)"""
+    q = p ** e
+    order = p - 1
+    for r in factorize(p - 1):
+        while order % r == 0 and pow(a, order // r, p) == 1:
+            order //= r
+    # Подъём с p на p^e: порядок умножается на степень p
+    while pow(a, order, q) != 1:
+        order *= p
+    return order
+
+
+def _local_period(a, d, p, e):
+    """
+    Период последовательности по модулю p^e при a, не делящемся на p.
+    x_n - x_0 = d * (1 + a + ... + a^(n-1)), d = x_1 - x_0, поэтому ищется наименьшее n,
+    при котором S_n = 1 + a + ... + a^(n-1) делится на p^f, f = e - v_p(d).
+    """
+    f = e - min(valuation(d, p), e)
+    if f == 0:
+        return 1
+    q = p ** f
+    if (a - 1) % p:
+        # a - 1 обратимо: S_n = (a^n - 1) / (a - 1) делится на p^f тогда и только тогда, когда a^n = 1
+        return multiplicative_order(a, p, f)
+    # a = 1 mod p: отображения x -> a * x + 1 образуют p-группу, период - степень p
+    n = 1
+    while affine_power(a, 1, n, q)[1] != 0:
+        n *= p
+    return n
+
+
+def hull_dobell(a, c, m):
+    """Условия Халла-Добелла: полный период m при любом начальном значении"""
+    if m == 1:
+        return True
+    if gcd(c, m) != 1:
+        return False
+    for p in factorize(m):
+        if (a - 1) % p:
+            return False
+    return m % 4 != 0 or (a - 1) % 4 == 0
+
+
+def _value_bits(values, width, k):
+    """Старшие k из width битов каждого значения массивом битов np.uint8, старший бит первым"""
+    if values.dtype == object:
+        text = ''.join(format(int(x) >> (width - k), f'0{k}b') for x in values)
+        return np.frombuffer(text.encode(), dtype=np.uint8) - ord('0')
+    # Нужные биты сдвигаются к старшему краю 64-битового слова, слово раскладывается по байтам big-endian
+    top = values.astype(np.uint64, copy=False) >> np.uint64(width - k) << np.uint64(64 - k)
+    return np.unpackbits(top.astype('>u8').view(np.uint8).reshape(-1, 8), axis=1)[:, :k].ravel()
+
+
+class LCG:
+    """
+    Линейный конгруэнтный генератор x_{n+1} = (a * x_n + c) mod m, состояние - текущее x.
+    width - число битов при выводе (по умолчанию разрядность m - 1, для m = 137 это 8, как в Lab_1.py).
+    out_bits - сколько старших из width битов каждого значения выдаёт next_bytes (по умолчанию все).
+    """
+
+    def __init__(self, a=9, c=12, m=137, x0=1, width=None, out_bits=None):
+        if m < 1:
+            raise ValueError("Модуль должен быть положительным")
+        self.a, self.c, self.m = a % m, c % m, m
+        self.x0 = x0 % m
+        self.state = self.x0
+        self.width = width or max(1, (m - 1).bit_length())
+        self.out_bits = min(out_bits or self.width, self.width)
+        self._pending = np.zeros(0, dtype=np.uint8)  # биты, выданные генератором, но ещё не next_bytes
+
+    def __repr__(self):
+        return f"LCG(a={self.a}, c={self.c}, m={self.m}, x0={self.state})"
+
+    def copy(self):
+        reg = LCG(self.a, self.c, self.m, self.x0, self.width, self.out_bits)
+        reg.state = self.state
+        reg._pending = self._pending.copy()
+        return reg
+
+    def next(self):
+        self.state = (self.a * self.state + self.c) % self.m
+        return self.state
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.next()
+
+    def next_n(self, n):
+        """Следующие n значений списком"""
+        a, c, m, x = self.a, self.c, self.m, self.state
+        out = []
+        for _ in range(n):
+            x = (a * x + c) % m
+            out.append(x)
+        self.state = x
+        return out
+
+    def _array_mode(self):
+        # Как считать по массивам: 'pow2' - uint64 с переполнением (m = 2^k, k <= 64),
+        # 'uint64' - a * x + c помещается в 64 бита, 'object' - числа Python (любой модуль)
+        m = self.m
+        if m & (m - 1) == 0 and m <= 1 << 64:
+            return 'pow2'
+        if (m - 1) * self.a + self.c < 1 << 64:
+            return 'uint64'
+        return 'object'
+
+    def next_array(self, n, lanes=None):
+        """
+        Следующие n значений массивом NumPy (np.uint64, для m > 2^64 - массив чисел Python).
+        Массив заполняется по дорожкам: дорожка j начинает с x_(j * steps), найденного прыжком,
+        и все дорожки делают шаг генератора одной векторной операцией.
+        """
+        mode = self._array_mode()
+        if n <= 0:
+            return np.zeros(0, dtype=object if mode == 'object' else np.uint64)
+        lanes = lanes or min(n, max(64, isqrt(n)))
+        steps = -(-n // lanes)
+
+        A, C = affine_power(self.a, self.c, steps, self.m)
+        starts = [self.state]
+        for _ in range(lanes - 1):
+            starts.append((A * starts[-1] + C) % self.m)
+
+        if mode == 'object':
+            x = np.array(starts, dtype=object)
+            a, c, m = self.a, self.c, self.m
+            out = np.empty((steps, lanes), dtype=object)
+            for t in range(steps):
+                x = (x * a + c) % m
+                out[t] = x
+        else:
+            x = np.array(starts, dtype=np.uint64)
+            a, c = np.uint64(self.a), np.uint64(self.c)
+            out = np.empty((steps, lanes), dtype=np.uint64)
+            mask = np.uint64(self.m - 1)
+            for t in range(steps):
+                np.multiply(x, a, out=x)
+                np.add(x, c, out=x)
+                if mode == 'uint64':
+                    np.remainder(x, np.uint64(self.m), out=x)
+                elif self.m != 1 << 64:
+                    np.bitwise_and(x, mask, out=x)
+                out[t] = x
+
+        self.skip(n)
+        return out.T.ravel()[:n]
+
+    def next_bytes(self, n, block=1 << 16):
+        """
+        n байтов выхода - общий интерфейс источника битов (как LFSR.next_bytes, см. randomness_tests):
+        от каждого значения берутся старшие out_bits битов, старший первым, как format(x, '08b') в Lab_1.py.
+        Значения считаются next_array и переводятся в биты порциями по block значений.
+        Лишние биты последнего значения сохраняются для следующего вызова.
+        """
+        k = self.out_bits
+        count = max(0, -(-(8 * n - len(self._pending)) // k))
+        values = self.next_array(count)
+        chunks = []
+        carry = self._pending
+        for i in range(0, max(count, 1), block):  # хотя бы одна порция - для оставшихся битов
+            bits = np.concatenate((carry, _value_bits(values[i:i + block], self.width, k)))
+            cut = len(bits) - len(bits) % 8
+            chunks.append(np.packbits(bits[:cut]).tobytes())
+            carry = bits[cut:]
+        data = b''.join(chunks)
+        self._pending = np.concatenate((np.unpackbits(np.frombuffer(data[n:], dtype=np.uint8)), carry))
+        return data[:n]
+
+    def skip(self, n):
+        """Сдвиг на n шагов вперёд за O(log n) умножений"""
+        A, C = affine_power(self.a, self.c, n, self.m)
+        self.state = (A * self.state + C) % self.m
+        return self
+
+    def format(self, x):  # Двоичная запись значения фиксированной ширины
+        return format(x, f'0{self.width}b')
+
+    def period_analysis(self, x0=None):
+        """
+        Период без перебора: {'factors' - разложение m, 'hull_dobell' - выполнены ли условия
+        Халла-Добелла, 'period' и 'preperiod' - для начального значения x0 (по умолчанию текущего),
+        'max_period' - наибольший период по всем начальным значениям}.
+        """
+        x0 = self.state if x0 is None else x0 % self.m
+        a, c, m = self.a, self.c, self.m
+        factors = factorize(m)
+        d = ((a - 1) * x0 + c) % m  # x_1 - x_0
+        period = max_period = 1
+        preperiod = 0
+        for p, e in factors.items():
+            q = p ** e
+            if a % p == 0:
+                # a необратимо по модулю p^e: после нескольких шагов последовательность постоянна
+                v = valuation(d % q, p)
+                if v < e:
+                    preperiod = max(preperiod, -(-(e - v) // valuation(a % q or q, p)))
+                continue
+            period = lcm(period, _local_period(a, d % q, p, e))
+            # x_1 - x_0 = (a - 1) * x_0 + c: наименьшая степень p в нём даёт наибольший период
+            max_period = lcm(max_period, _local_period(a, gcd(a - 1, c, q), p, e))
+        return {
+            'factors': factors,
+            'hull_dobell': hull_dobell(a, c, m),
+            'period': period,
+            'preperiod': preperiod,
+            'max_period': max_period,
+        }
+
+    def period(self, x0=None):
+        return self.period_analysis(x0)['period']
+
+
+# --- Битовая статистика (как в Lab_1.py, но по массивам и для любой разрядности) ---
+
+_BYTE_BITS = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1, bitorder='little').astype(np.int64)
+
+
+def popcount(values):  # Число единичных битов каждого элемента
+    if values.dtype == object:
+        return np.frompyfunc(int.bit_count, 1, 1)(values)
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(values)
+    return _BYTE_BITS.sum(axis=1)[values.view(np.uint8)].reshape(len(values), -1).sum(axis=1)
+
+
+def bit_statistics(values, width):
+    """
+    Статистика значений шириной width битов: {'count', 'even', 'odd' (чётные/нечётные),
+    'zeros', 'ones' (всего нулевых/единичных битов), 'bit_ones' - единицы по позициям, младший бит первый}.
+    """
+    count = len(values)
+    if values.dtype == object:
+        ones = int(popcount(values).sum()) if count else 0
+        bit_ones = np.array([int(((values >> k) & 1).sum()) if count else 0 for k in range(width)], dtype=np.int64)
+        odd = int(bit_ones[0]) if width else 0
+    else:
+        ones = int(popcount(values).sum(dtype=np.int64))
+        # Позиции битов - по гистограммам байтов: один проход np.bincount на байт слова
+        data = values.astype('<u8', copy=False).view(np.uint8).reshape(count, 8)
+        bit_ones = np.zeros(max(64, width), dtype=np.int64)
+        for j in range(min(8, -(-width // 8))):
+            hist = np.bincount(data[:, j], minlength=256)
+            bit_ones[8 * j:8 * j + 8] = hist @ _BYTE_BITS
+        bit_ones = bit_ones[:width]
+        odd = int(bit_ones[0])
+    return {
+        'count': count,
+        'even': count - odd,
+        'odd': odd,
+        'zeros': width * count - ones,
+        'ones': ones,
+        'bit_ones': bit_ones,
+    }
+
+
+def merge_statistics(total, part):  # Сумма двух результатов bit_statistics
+    if total is None:
+        return part
+    return {key: total[key] + part[key] for key in total}
+
+
+def _block_statistics(a, c, m, state, width, count, lanes):
+    # Статистика count значений после состояния state (для пула процессов)
+    return bit_statistics(LCG(a, c, m, state, width).next_array(count, lanes), width)
+
+
+def stream_statistics(reg, n, block=1 << 22, workers=1, lanes=None):
+    """
+    Статистика следующих n значений генератора блоками по block значений, без хранения всего потока.
+    Начало каждого блока находится прыжком, поэтому блоки считаются в workers процессах независимо.
+    К результату bit_statistics добавляется 'bias' - доля единиц на каждой позиции минус 0.5.
+    """
+    workers = workers or os.cpu_count() or 1
+    args = []
+    x = reg.copy()
+    for start in range(0, n, block):
+        count = min(block, n - start)
+        args.append((reg.a, reg.c, reg.m, x.state, reg.width, count, lanes))
+        x.skip(count)
+    reg.state = x.state
+
+    total = None
+    if workers == 1 or len(args) == 1:
+        for arg in args:
+            total = merge_statistics(total, _block_statistics(*arg))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for part in pool.map(_block_statistics, *zip(*args)):
+                total = merge_statistics(total, part)
+    if total is None:
+        total = bit_statistics(np.zeros(0, dtype=np.uint64), reg.width)
+    total['bias'] = total['bit_ones'] / max(total['count'], 1) - 0.5
+    return total
@@ -0,0 +1,121 @@
+# lcg_search.py
+"""
+Поиск параметров (a, c) линейного конгруэнтного генератора для заданного модуля m.
+
+Кандидаты сразу берутся только среди удовлетворяющих условиям Халла-Добелла (полный период m),
+поэтому перебирать пары и считать период не нужно. Затем отсекаются множители с плохой
+решёткой (спектральный тест, spectral.py), оставшиеся кандидаты оцениваются
+батареей статистических тестов (randomness_tests.py) в пуле процессов,
+результаты сохраняются в JSON-файл после каждой порции, чтобы прерванный поиск можно было продолжить.
+"""
+import argparse
+import random
+from math import gcd, prod
+
+from batch_cache import run_cached_batches
+from lcg import LCG, parse_int
+from numtheory import factorize
+from randomness_tests import run_battery
+from spectral import figure_of_merit
+
+
+def multiplier_step(m):
+    """a должно быть = 1 по модулю каждого простого делителя m (и по модулю 4, если 4 | m): шаг между такими a"""
+    step = prod(factorize(m))
+    if m % 4 == 0 and step % 4:
+        step *= 2
+    return step
+
+
+def hull_dobell_candidates(m, count=256, seed=0, exclude_trivial=True):
+    """
+    Пары (a, c) с полным периодом m. Если всех пар не больше count, возвращаются все,
+    иначе - count случайных пар (random.Random(seed)), без повторов.
+    exclude_trivial убирает a = 1 (x + c по модулю m), если есть другие множители.
+    """
+    step = multiplier_step(m)
+    n_a = max(1, m // step)
+    first_k = 1 if exclude_trivial and n_a > 1 else 0
+    totient = prod((p - 1) * p ** (e - 1) for p, e in factorize(m).items())
+
+    if (n_a - first_k) * totient <= count:
+        return [(1 + k * step, c) for k in range(first_k, n_a) for c in range(m) if gcd(c, m) == 1]
+
+    rng = random.Random(seed)
+    pairs = set()
+    while len(pairs) < count:
+        a = (1 + rng.randrange(first_k, n_a) * step) % m
+        c = rng.randrange(1, m)
+        if gcd(c, m) == 1:
+            pairs.add((a, c))
+    return sorted(pairs)
+
+
+def score_params(a, c, m, nbits=1 << 20, out_bits=32, x0=1):
+    """
+    Оценка пары (a, c): p-значения батареи, число пройденных тестов и наименьшее p-значение.
+    От каждого значения берутся старшие out_bits битов (младшие биты LCG с модулем 2^k слабые).
+    """
+    pvalues = {name: float(p) for name, p in run_battery(LCG(a, c, m, x0, out_bits=out_bits), nbits).items()}
+    return {
+        'a': a,
+        'c': c,
+        'passed': sum(p >= 0.01 for p in pvalues.values()),
+        'min_p': min(pvalues.values()),
+        'pvalues': pvalues,
+    }
+
+
+def _score_batch(pairs, m, nbits, out_bits):
+    return [score_params(a, c, m, nbits, out_bits) for a, c in pairs]
+
+
+def _pair_key(pair):  # Ключ пары в JSON-файле результатов
+    return f"{pair[0]},{pair[1]}"
+
+
+def lcg_search(m, count=256, nbits=1 << 20, out_bits=32, seed=0, workers=None, cache_path=None, batch=8,
+               min_merit=0.0, dims=range(2, 9)):
+    """
+    Оценивает кандидатов hull_dobell_candidates(m, count, seed) и возвращает список оценок,
+    лучшие первыми: больше пройденных тестов, затем лучше спектральный тест ('merit' - наименьшее S_t
+    по размерностям dims), затем большее наименьшее p-значение.
+    Кандидаты с merit < min_merit отбрасываются до статистических тестов.
+    Уже оценённые пары берутся из cache_path (JSON), новые дописываются туда после каждой порции.
+    """
+    pairs = hull_dobell_candidates(m, count, seed)
+    merits = {a: figure_of_merit(a, m, dims) for a in {a for a, _ in pairs}}
+    pairs = [(a, c) for a, c in pairs if merits[a] >= min_merit]
+    done = run_cached_batches(f"{m}:{nbits}:{out_bits}", pairs, _score_batch, (m, nbits, out_bits),
+                              item_key=_pair_key, workers=workers, cache_path=cache_path, batch=batch)
+
+    scores = [dict(done[_pair_key(pair)], merit=merits[pair[0]]) for pair in pairs]
+    scores.sort(key=lambda r: (-r['passed'], -r['merit'], -r['min_p'], r['a'], r['c']))
+    return scores
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Поиск параметров линейного конгруэнтного генератора")
+    parser.add_argument('m', type=parse_int, help="модуль (например 137, 2^32, 2^64)")
+    parser.add_argument('--count', type=int, default=64, help="сколько пар (a, c) оценить")
+    parser.add_argument('--bits', type=int, default=1 << 20, help="объём выхода на пару в битах")
+    parser.add_argument('--out-bits', type=int, default=32, help="сколько старших битов значения брать")
+    parser.add_argument('--seed', type=int, default=0, help="зерно выбора кандидатов")
+    parser.add_argument('--min-merit', type=float, default=0.0, help="наименьший допустимый S_t (от 0 до 1)")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="число процессов")
+    parser.add_argument('--cache', default=None, help="JSON-файл с результатами")
+    parser.add_argument('--top', type=int, default=20, help="сколько лучших пар показать")
+    args = parser.parse_args(argv)
+
+    scores = lcg_search(args.m, args.count, args.bits, args.out_bits, args.seed, args.workers, args.cache,
+                        min_merit=args.min_merit)
+    print(f"m = {args.m}, оценено пар: {len(scores)}")
+    print("a".ljust(22), "||", "c".ljust(22), "||", "Пройдено".center(8), "||", "S_t".center(6), "||", "Мин. p")
+    for r in scores[:args.top]:
+        print(f"{r['a']}".ljust(22), "||", f"{r['c']}".ljust(22), "||",
+              f"{r['passed']}/{len(r['pvalues'])}".center(8), "||", f"{r['merit']:.3f}".center(6), "||",
+              f"{r['min_p']:.6f}")
+
+
+if __name__ == '__main__':
+    main()
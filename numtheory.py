@@ -0,0 +1,81 @@
+# numtheory.py
+"""
+Теория чисел для анализа периодов: проверка простоты и разложение целых чисел на множители
+(общее для lcg.py и Lab_3/lfsr_analysis.py).
+"""
+import random
+from math import gcd
+
+SMALL_PRIMES = [p for p in range(2, 1000) if all(p % q for q in range(2, int(p ** 0.5) + 1))]
+
+
+def is_prime(n):  # Тест Миллера-Рабина (детерминированный до 3.3 * 10^24, дальше - с высокой вероятностью)
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES[:25]:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    bases = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+    if n >= 3317044064679887385961981:
+        bases += [random.randrange(2, n - 1) for _ in range(16)]
+    for a in bases:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def pollard_brent(n):  # Нетривиальный делитель составного n (ро-метод Полларда в варианте Брента)
+    if n % 2 == 0:
+        return 2
+    while True:
+        y, c, m = random.randrange(1, n), random.randrange(1, n), 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+def factorize(n):
+    """Разложение n на простые множители: {простое: степень}"""
+    factors = {}
+    for p in SMALL_PRIMES:
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if is_prime(m):
+            factors[m] = factors.get(m, 0) + 1
+        else:
+            d = pollard_brent(m)
+            stack += [d, m // d]
+    return dict(sorted(factors.items()))
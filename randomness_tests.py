@@ -0,0 +1,259 @@
+# randomness_tests.py
+"""
+Батарея статистических тестов для выходов генераторов (по мотивам NIST SP 800-22 и FIPS 140-1).
+
+Тесты работают с массивами битов NumPy (np.uint8, значения 0/1). Генератор подключается
+через общий интерфейс источника битов - объект с методом next_bytes(n), который возвращает
+n байтов упакованных битов (первый бит - старший бит байта), как LFSR.next_bytes.
+Каждый тест возвращает p-значение: выход считается случайным на уровне 0.01, если p >= 0.01.
+"""
+import math
+
+import numpy as np
+
+from berlekamp_massey import linear_complexity
+
+
+# --- Источники битов ---
+
+class IntegerBitSource:
+    """
+    Источник битов из генератора целых чисел: next_value() -> число, каждое число
+    даёт width битов (старший первым), как format(n, '08b') в Lab_1.py.
+    """
+
+    def __init__(self, next_value, width=8):
+        self.next_value = next_value
+        self.width = width
+        self._pending = 0
+        self._pending_len = 0
+
+    def next_bytes(self, n):
+        out = bytearray()
+        acc, acc_len = self._pending, self._pending_len
+        while len(out) < n:
+            acc = (acc << self.width) | (self.next_value() & ((1 << self.width) - 1))
+            acc_len += self.width
+            while acc_len >= 8 and len(out) < n:
+                acc_len -= 8
+                out.append((acc >> acc_len) & 0xFF)
+            acc &= (1 << acc_len) - 1
+        self._pending, self._pending_len = acc, acc_len
+        return bytes(out)
+
+
+def to_bits(data, nbits=None):
+    """
+    Приводит вход к массиву битов np.uint8:
+    массив NumPy (уже биты), bytes (упакованные биты), строка из '0'/'1', список битов
+    или источник с next_bytes (тогда нужен nbits).
+    """
+    if hasattr(data, 'next_bytes'):
+        if nbits is None:
+            raise ValueError("Для источника битов нужно указать nbits")
+        bits = np.unpackbits(np.frombuffer(data.next_bytes((nbits + 7) // 8), dtype=np.uint8))
+    elif isinstance(data, np.ndarray):
+        bits = data.astype(np.uint8, copy=False)
+    elif isinstance(data, (bytes, bytearray, memoryview)):
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+    elif isinstance(data, str):
+        bits = np.frombuffer(data.encode(), dtype=np.uint8) - ord('0')
+    else:
+        bits = np.asarray(list(data), dtype=np.uint8)
+    return bits[:nbits] if nbits is not None else bits
+
+
+# --- Специальные функции ---
+
+def igamc(a, x):
+    """Регуляризованная верхняя неполная гамма-функция Q(a, x)"""
+    if x <= 0:
+        return 1.0
+    if x < a + 1:
+        # Ряд для P(a, x)
+        term = total = 1.0 / a
+        n = a
+        while abs(term) > abs(total) * 1e-15:
+            n += 1
+            term *= x / n
+            total += term
+        return max(0.0, 1.0 - total * math.exp(-x + a * math.log(x) - math.lgamma(a)))
+
+    # Цепная дробь для Q(a, x) (метод Лентца)
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    i = 1
+    while True:
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+        i += 1
+    return math.exp(-x + a * math.log(x) - math.lgamma(a)) * h
+
+
+# --- Тесты ---
+
+def monobit_test(bits):  # Частотный тест: доля единиц
+    n = len(bits)
+    if n == 0:
+        return float('nan')
+    s = 2 * int(np.count_nonzero(bits)) - n
+    return math.erfc(abs(s) / math.sqrt(n) / math.sqrt(2))
+
+
+def block_frequency_test(bits, block=128):  # Частотный тест в блоках
+    n_blocks = len(bits) // block
+    if n_blocks == 0:
+        return float('nan')
+    pi = bits[:n_blocks * block].reshape(n_blocks, block).sum(axis=1) / block
+    chi2 = 4 * block * float(np.sum((pi - 0.5) ** 2))
+    return igamc(n_blocks / 2, chi2 / 2)
+
+
+def runs_test(bits):  # Тест на серии: число смен значения
+    n = len(bits)
+    if n == 0:
+        return float('nan')
+    pi = np.count_nonzero(bits) / n
+    if abs(pi - 0.5) >= 2 / math.sqrt(n):
+        return 0.0
+    v = 1 + int(np.count_nonzero(bits[1:] != bits[:-1]))
+    return math.erfc(abs(v - 2 * n * pi * (1 - pi)) / (2 * math.sqrt(2 * n) * pi * (1 - pi)))
+
+
+# Параметры теста на самую длинную серию единиц: длина блока -> (границы классов, вероятности)
+LONGEST_RUN_CLASSES = {
+    8: ((1, 4), [0.2148, 0.3672, 0.2305, 0.1875]),
+    128: ((4, 9), [0.1174, 0.2430, 0.2493, 0.1752, 0.1027, 0.1124]),
+    10000: ((10, 16), [0.0882, 0.2092, 0.2483, 0.1933, 0.1208, 0.0675, 0.0727]),
+}
+
+
+def longest_runs(bits, block):
+    """Длина самой длинной серии единиц в каждом блоке"""
+    n_blocks = len(bits) // block
+    rows = bits[:n_blocks * block].reshape(n_blocks, block)
+    # Разделяем блоки нулевым столбцом, чтобы серии не переходили через границу
+    flat = np.hstack([rows, np.zeros((n_blocks, 1), dtype=np.uint8)]).ravel()
+    edges = np.diff(np.concatenate(([0], flat, [0])).astype(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    longest = np.zeros(n_blocks, dtype=np.int64)
+    np.maximum.at(longest, starts // (block + 1), ends - starts)
+    return longest
+
+
+def longest_run_test(bits):  # Тест на самую длинную серию единиц в блоке
+    n = len(bits)
+    if n < 128:
+        return float('nan')
+    block = 8 if n < 6272 else 128 if n < 750000 else 10000
+    (low, high), probs = LONGEST_RUN_CLASSES[block]
+    longest = np.clip(longest_runs(bits, block), low, high)
+    counts = np.bincount(longest - low, minlength=high - low + 1)
+    n_blocks = len(longest)
+    chi2 = sum((counts[i] - n_blocks * p) ** 2 / (n_blocks * p) for i, p in enumerate(probs))
+    return igamc((len(probs) - 1) / 2, chi2 / 2)
+
+
+def _pattern_counts(bits, m):
+    # Частоты всех перекрывающихся m-битовых шаблонов (последовательность замкнута в кольцо)
+    if m == 0:
+        return np.array([len(bits)])
+    ext = np.concatenate((bits, bits[:m - 1])).astype(np.int64)
+    values = np.zeros(len(bits), dtype=np.int64)
+    for k in range(m):
+        values = (values << 1) | ext[k:k + len(bits)]
+    return np.bincount(values, minlength=1 << m)
+
+
+def serial_test(bits, m=3):  # Сериальный тест: равномерность перекрывающихся m-битовых шаблонов
+    n = len(bits)
+    if n == 0:
+        return float('nan'), float('nan')
+    psi = [(1 << k) / n * float(np.sum(_pattern_counts(bits, k).astype(np.float64) ** 2)) - n if k > 0 else 0.0
+           for k in (m, m - 1, m - 2)]
+    d1 = psi[0] - psi[1]
+    d2 = psi[0] - 2 * psi[1] + psi[2]
+    return igamc(2 ** (m - 2), d1 / 2), igamc(2 ** (m - 3), d2 / 2)
+
+
+def poker_test(bits, m=4):  # Покер-тест: неперекрывающиеся m-битовые блоки
+    k = len(bits) // m
+    if k == 0:
+        return float('nan')
+    weights = 1 << np.arange(m - 1, -1, -1)
+    values = bits[:k * m].reshape(k, m).astype(np.int64) @ weights
+    counts = np.bincount(values, minlength=1 << m).astype(np.float64)
+    x = (1 << m) / k * float(np.sum(counts ** 2)) - k
+    return igamc(((1 << m) - 1) / 2, x / 2)
+
+
+def autocorrelation_test(bits, shift=1):  # Автокорреляция: совпадения последовательности со сдвигом
+    n = len(bits) - shift
+    if n <= 0:
+        return float('nan')
+    a = int(np.count_nonzero(bits[:n] != bits[shift:]))
+    z = 2 * (a - n / 2) / math.sqrt(n)
+    return math.erfc(abs(z) / math.sqrt(2))
+
+
+LINEAR_COMPLEXITY_PROBS = [0.010417, 0.03125, 0.125, 0.5, 0.25, 0.0625, 0.020833]
+
+
+def linear_complexity_test(bits, block=500, max_blocks=2000):
+    """
+    Тест линейной сложности: отклонение сложности блоков от ожидаемой.
+    Берётся не больше max_blocks блоков (для 500-битовых блоков это 10^6 битов, как требует NIST).
+    """
+    n_blocks = min(len(bits) // block, max_blocks)
+    if n_blocks == 0:
+        return float('nan')
+    mu = block / 2 + (9 + (-1) ** (block + 1)) / 36 - (block / 3 + 2 / 9) / 2 ** block
+    counts = [0] * 7
+    for i in range(n_blocks):
+        t = (-1) ** block * (linear_complexity(bits[i * block:(i + 1) * block]) - mu) + 2 / 9
+        if t <= -2.5:
+            counts[0] += 1
+        elif t > 2.5:
+            counts[6] += 1
+        else:
+            counts[math.ceil(t + 2.5)] += 1
+    chi2 = sum((counts[i] - n_blocks * p) ** 2 / (n_blocks * p) for i, p in enumerate(LINEAR_COMPLEXITY_PROBS))
+    return igamc(3, chi2 / 2)
+
+
+def run_battery(data, nbits=None):
+    """Все тесты сразу: {название теста: p-значение}"""
+    bits = to_bits(data, nbits)
+    serial_1, serial_2 = serial_test(bits)
+    return {
+        'monobit': monobit_test(bits),
+        'block_frequency': block_frequency_test(bits),
+        'runs': runs_test(bits),
+        'longest_run': longest_run_test(bits),
+        'serial_1': serial_1,
+        'serial_2': serial_2,
+        'poker': poker_test(bits),
+        'autocorrelation': autocorrelation_test(bits),
+        'linear_complexity': linear_complexity_test(bits),
+    }
+
+
+def print_report(results, alpha=0.01):
+    print("Тест".ljust(18), "||", "p-значение".center(12), "||", "Результат")
+    for name, p in results.items():
+        # NaN - тест неприменим (например, последовательность короче блока теста)
+        verdict = "неприменим" if math.isnan(p) else "пройден" if p >= alpha else "не пройден"
+        print(name.ljust(18), "||", f"{p:.6f}".center(12), "||", verdict)
@@ -0,0 +1,197 @@
+# spectral.py
+"""
+Спектральный тест линейного конгруэнтного генератора x -> (a * x + c) mod m.
+
+Точки (x_n, x_(n+1), ..., x_(n+t-1)) лежат на семействах параллельных гиперплоскостей;
+наибольшее расстояние между соседними гиперплоскостями равно 1 / nu_t, где nu_t - длина
+кратчайшего ненулевого вектора двойственной решётки
+{u : u_1 + a * u_2 + ... + a^(t-1) * u_t = 0 (mod m)}. Результат не зависит от c.
+
+Базис решётки сокращается целочисленным алгоритмом LLL (все вычисления на целых числах Python),
+после чего кратчайший вектор находится точным перебором Финке-Поста в сокращённом базисе.
+"""
+import argparse
+import math
+import time
+
+from lcg import parse_int
+
+# Константы Эрмита gamma_t^t для t = 1..8 (наибольшая плотность решётки)
+HERMITE_POWER = {1: 1, 2: 4 / 3, 3: 2, 4: 4, 5: 8, 6: 64 / 3, 7: 64, 8: 256}
+
+
+def dual_basis(a, m, t):
+    """Базис двойственной решётки размерности t: (m, 0, ..., 0) и (-a^i mod m, ..., 1 на месте i)"""
+    basis = [[m] + [0] * (t - 1)]
+    power = 1
+    for i in range(1, t):
+        power = power * a % m
+        row = [0] * t
+        row[0] = -power
+        row[i] = 1
+        basis.append(row)
+    return basis
+
+
+def _dot(u, v):
+    return sum(x * y for x, y in zip(u, v))
+
+
+def lll_reduce(basis, delta=(99, 100)):
+    """
+    LLL-сокращение базиса (целочисленный вариант, Cohen, алгоритм 2.6.7): вместо дробей
+    хранятся d_i (определители Грама) и lambda_ij = d_j * mu_ij, все деления точные.
+    delta = (числитель, знаменатель) - параметр условия Ловаса. Возвращает новый базис.
+    """
+    b = [list(row) for row in basis]
+    n = len(b)
+    num, den = delta
+    d = [1] + [0] * n  # d[i + 1] - определитель Грама первых i + 1 векторов
+    lam = [[0] * n for _ in range(n)]
+    d[1] = _dot(b[0], b[0])
+    if d[1] == 0:
+        raise ValueError("Векторы базиса линейно зависимы")
+
+    def reduce(k, l):  # b_k -= q * b_l, чтобы |mu_kl| <= 1/2
+        if 2 * abs(lam[k][l]) > d[l + 1]:
+            q = (2 * lam[k][l] + d[l + 1]) // (2 * d[l + 1])
+            b[k] = [x - q * y for x, y in zip(b[k], b[l])]
+            lam[k][l] -= q * d[l + 1]
+            for i in range(l):
+                lam[k][i] -= q * lam[l][i]
+
+    def swap(k):
+        b[k], b[k - 1] = b[k - 1], b[k]
+        for j in range(k - 1):
+            lam[k][j], lam[k - 1][j] = lam[k - 1][j], lam[k][j]
+        lk = lam[k][k - 1]
+        B = (d[k - 1] * d[k + 1] + lk * lk) // d[k]
+        for i in range(k + 1, k_max + 1):
+            t = lam[i][k]
+            lam[i][k] = (d[k + 1] * lam[i][k - 1] - lk * t) // d[k]
+            lam[i][k - 1] = (B * t + lk * lam[i][k]) // d[k + 1]
+        d[k] = B
+
+    k, k_max = 1, 0
+    while k < n:
+        if k > k_max:  # Ортогонализация Грама-Шмидта для нового вектора
+            k_max = k
+            for j in range(k + 1):
+                u = _dot(b[k], b[j])
+                for i in range(j):
+                    u = (d[i + 1] * u - lam[k][i] * lam[j][i]) // d[i]
+                if j < k:
+                    lam[k][j] = u
+                else:
+                    if u == 0:
+                        raise ValueError("Векторы базиса линейно зависимы")
+                    d[k + 1] = u
+        while True:
+            reduce(k, k - 1)
+            # Условие Ловаса: d_k * d_(k-2) >= delta * d_(k-1)^2 - lambda^2 (в целых числах)
+            if den * d[k + 1] * d[k - 1] < num * d[k] ** 2 - den * lam[k][k - 1] ** 2:
+                swap(k)
+                k = max(1, k - 1)
+            else:
+                break
+        for l in range(k - 2, -1, -1):
+            reduce(k, l)
+        k += 1
+    return b
+
+
+def shortest_vector(basis):
+    """
+    Кратчайший ненулевой вектор решётки: перебор Финке-Поста по сокращённому базису.
+    Ортогонализация считается в числах с плавающей точкой только для границ перебора,
+    длины векторов-кандидатов считаются точно. Возвращает (квадрат длины, вектор).
+    """
+    b = lll_reduce(basis)
+    n = len(b)
+    best = min(b, key=lambda v: _dot(v, v))
+    best_norm = _dot(best, best)
+
+    # Грам-Шмидт: mu[i][j] и квадраты длин ортогональных векторов bstar[i]
+    mu = [[0.0] * n for _ in range(n)]
+    bstar = [0.0] * n
+    ortho = []
+    for i in range(n):
+        v = [float(x) for x in b[i]]
+        for j in range(i):
+            mu[i][j] = sum(float(x) * y for x, y in zip(b[i], ortho[j])) / bstar[j]
+            v = [x - mu[i][j] * y for x, y in zip(v, ortho[j])]
+        ortho.append(v)
+        bstar[i] = sum(x * x for x in v)
+
+    coeffs = [0] * n
+
+    def search(level, partial):
+        # partial - вклад уровней выше level в квадрат длины
+        nonlocal best, best_norm
+        center = -sum(coeffs[j] * mu[j][level] for j in range(level + 1, n))
+        radius = math.sqrt(max(0.0, (best_norm * (1 + 1e-9) - partial) / bstar[level]))
+        for x in range(math.ceil(center - radius), math.floor(center + radius) + 1):
+            coeffs[level] = x
+            part = partial + (x - center) ** 2 * bstar[level]
+            if part > best_norm * (1 + 1e-9):
+                continue
+            if level:
+                search(level - 1, part)
+            elif any(coeffs):
+                v = [sum(c * row[i] for c, row in zip(coeffs, b)) for i in range(n)]
+                norm = _dot(v, v)
+                if norm < best_norm:
+                    best, best_norm = v, norm
+        coeffs[level] = 0
+
+    search(n - 1, 0.0)
+    return best_norm, best
+
+
+def spectral_test(a, m, dims=range(2, 9)):
+    """
+    Спектральный тест для размерностей dims: {t: {'nu2' - квадрат nu_t (точно), 'nu',
+    'vector' - кратчайший вектор, 'merit' - S_t = nu_t / (gamma_t^(1/2) * m^(1/t)), от 0 до 1,
+    'mu' - мера Кнута mu_t = pi^(t/2) * nu_t^t / (Gamma(t/2 + 1) * m)}}.
+    """
+    result = {}
+    for t in dims:
+        if t == 1:
+            nu2, vector = m * m, [m]
+        else:
+            nu2, vector = shortest_vector(dual_basis(a, m, t))
+        log_nu = math.log(nu2) / 2
+        result[t] = {
+            'nu2': nu2,
+            'nu': math.exp(log_nu),
+            'vector': vector,
+            'merit': math.exp(log_nu - math.log(HERMITE_POWER[t]) / (2 * t) - math.log(m) / t),
+            'mu': math.exp(t / 2 * math.log(math.pi) + t * log_nu - math.lgamma(t / 2 + 1) - math.log(m)),
+        }
+    return result
+
+
+def figure_of_merit(a, m, dims=range(2, 9)):  # Наименьшее S_t по размерностям: 1 - идеальная решётка
+    return min(r['merit'] for r in spectral_test(a, m, dims).values())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Спектральный тест линейного конгруэнтного генератора")
+    parser.add_argument('a', type=parse_int, help="множитель")
+    parser.add_argument('m', type=parse_int, help="модуль (например 137, 2^64)")
+    parser.add_argument('--max-dim', type=int, default=8, help="наибольшая размерность (до 8)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    result = spectral_test(args.a, args.m, range(2, args.max_dim + 1))
+    elapsed = time.perf_counter() - start
+
+    print("t".ljust(3), "||", "nu_t".center(24), "||", "S_t".center(8), "||", "mu_t")
+    for t, r in result.items():
+        print(f"{t}".ljust(3), "||", f"{r['nu']:.6g}".center(24), "||", f"{r['merit']:.4f}".center(8), "||",
+              f"{r['mu']:.4g}")
+    print(f"Время: {elapsed:.3f} с")
+
+
+if __name__ == '__main__':
+    main()